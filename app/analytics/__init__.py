@@ -1,6 +1,7 @@
 from .gex_dashboard import (
+    ChainTable,
     build_dashboard_snapshot,
     flatten_option_chain,
 )
 
-__all__ = ["build_dashboard_snapshot", "flatten_option_chain"]
+__all__ = ["ChainTable", "build_dashboard_snapshot", "flatten_option_chain"]
@@ -0,0 +1,25 @@
+"""Optional Numba support for analytics kernels."""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args: Any, **kwargs: Any) -> Any:  # type: ignore[no-redef]
+        """No-op stand-in so kernels stay importable (and callable) without numba."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+            return func
+
+        return decorate
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit"]
@@ -2,8 +2,14 @@ from __future__ import annotations
 
 import datetime as dt
 import math
-from collections import defaultdict
-from typing import Any, Dict, List, Tuple
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from ._njit import NUMBA_AVAILABLE, njit
 
 
 def _safe_float(value: Any, default: float = 0.0) -> float:
@@ -43,54 +49,236 @@ def extract_quote_price(quote: Dict[str, Any]) -> float | None:
     return None
 
 
-def flatten_option_chain(chain: Dict[str, Any]) -> List[Dict[str, Any]]:
-    rows: List[Dict[str, Any]] = []
-    for side_name, side_map in (("CALL", chain.get("callExpDateMap", {})), ("PUT", chain.get("putExpDateMap", {}))):
-        if not isinstance(side_map, dict):
+SIDE_CALL = 0
+SIDE_PUT = 1
+SIDE_NAMES = ("CALL", "PUT")
+
+_CHAIN_SIDES: Tuple[Tuple[int, str], ...] = ((SIDE_CALL, "callExpDateMap"), (SIDE_PUT, "putExpDateMap"))
+
+
+@dataclass
+class ChainTable:
+    """
+    Struct-of-arrays view of a flattened Schwab option chain.
+
+    Every column has one entry per contract. Numeric columns are float64 with
+    invalid/missing values already replaced by their defaults; `side` holds
+    SIDE_CALL / SIDE_PUT codes.
+    """
+
+    side: np.ndarray
+    symbol: np.ndarray
+    expiry: np.ndarray
+    dte: np.ndarray
+    strike: np.ndarray
+    bid: np.ndarray
+    ask: np.ndarray
+    last: np.ndarray
+    mark: np.ndarray
+    delta: np.ndarray
+    gamma: np.ndarray
+    theta: np.ndarray
+    vega: np.ndarray
+    iv: np.ndarray
+    open_interest: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.side.size)
+
+    def as_rows(self, indices: Sequence[int] | np.ndarray | None = None) -> List[Dict[str, Any]]:
+        """Materialize contracts as row dicts (all rows, or only `indices`)."""
+        if indices is None:
+            index = slice(None)
+        else:
+            index = np.asarray(indices, dtype=np.intp)
+        columns = {
+            "side": [SIDE_NAMES[code] for code in self.side[index].tolist()],
+            "symbol": self.symbol[index].tolist(),
+            "expiry": self.expiry[index].tolist(),
+            "dte": self.dte[index].tolist(),
+        }
+        for name in _FLOAT_COLUMNS:
+            columns[name] = getattr(self, name)[index].tolist()
+        keys = list(columns)
+        return [dict(zip(keys, values)) for values in zip(*columns.values())]
+
+
+_FLOAT_COLUMNS: Tuple[str, ...] = (
+    "strike",
+    "bid",
+    "ask",
+    "last",
+    "mark",
+    "delta",
+    "gamma",
+    "theta",
+    "vega",
+    "iv",
+    "open_interest",
+    "volume",
+)
+
+
+# Raw contract fields collected per row, in matrix column order. "volatility"
+# falls back to "iv" and "totalVolume" to "volume" after coercion.
+_RAW_FIELDS: Tuple[str, ...] = (
+    "bid",
+    "ask",
+    "last",
+    "mark",
+    "delta",
+    "gamma",
+    "theta",
+    "vega",
+    "volatility",
+    "iv",
+    "openInterest",
+    "totalVolume",
+    "volume",
+)
+
+
+def _coerce_float_matrix(rows: List[Tuple[Any, ...]], width: int) -> np.ndarray:
+    """Convert raw field tuples to a (width, n) float64 array; unparseable values become NaN."""
+    try:
+        matrix = np.array(rows, dtype=np.float64).reshape(len(rows), width)
+    except (TypeError, ValueError):
+        # Rare malformed payloads: coerce element by element instead.
+        matrix = np.empty((len(rows), width), dtype=np.float64)
+        for i, row in enumerate(rows):
+            for j, value in enumerate(row):
+                try:
+                    matrix[i, j] = value
+                except (TypeError, ValueError):
+                    matrix[i, j] = np.nan
+    return np.ascontiguousarray(matrix.T)
+
+
+def _iter_strike_maps(chain: Dict[str, Any]) -> Iterator[Tuple[int, str, List[Tuple[Any, Any]]]]:
+    # JSON payloads only hold dicts/lists/scalars, so a missing .items() means "not a map".
+    for side_code, map_key in _CHAIN_SIDES:
+        try:
+            expiries = chain.get(map_key, {}).items()
+        except AttributeError:
             continue
-        for exp_key, strike_map in side_map.items():
-            expiry, dte = _parse_expiry_key(exp_key)
-            if not isinstance(strike_map, dict):
+        for exp_key, strike_map in expiries:
+            try:
+                strike_items = list(strike_map.items())
+            except AttributeError:
+                continue
+            yield side_code, exp_key, strike_items
+
+
+def flatten_option_chain(chain: Dict[str, Any]) -> ChainTable:
+    # Walk the expiry maps once; the pre-scan and the fill loop share the result.
+    strike_groups = list(_iter_strike_maps(chain))
+    n = 0
+    for _, _, strike_items in strike_groups:
+        for _, contracts in strike_items:
+            if isinstance(contracts, list):
+                n += sum(1 for contract in contracts if isinstance(contract, dict))
+
+    side = np.empty(n, dtype=np.int8)
+    symbol = np.empty(n, dtype=object)
+    expiry_col = np.empty(n, dtype=object)
+    dte_col = np.empty(n, dtype=np.int64)
+    strike_col = np.empty(n, dtype=np.float64)
+    raw_rows: List[Tuple[Any, ...]] = []
+    append_row = raw_rows.append
+
+    i = 0
+    for side_code, exp_key, strike_items in strike_groups:
+        expiry, dte = _parse_expiry_key(exp_key)
+        for strike_key, contracts in strike_items:
+            if not isinstance(contracts, list):
                 continue
-            for strike_key, contracts in strike_map.items():
-                strike = _safe_float(strike_key)
-                if not isinstance(contracts, list):
+            start = i
+            for contract in contracts:
+                if not isinstance(contract, dict):
                     continue
-                for contract in contracts:
-                    if not isinstance(contract, dict):
-                        continue
-                    bid = _safe_float(contract.get("bid"))
-                    ask = _safe_float(contract.get("ask"))
-                    mark = _safe_float(contract.get("mark"), default=(bid + ask) / 2 if bid > 0 and ask > 0 else 0.0)
-                    last = _safe_float(contract.get("last"))
-
-                    rows.append(
-                        {
-                            "side": side_name,
-                            "symbol": contract.get("symbol"),
-                            "expiry": expiry,
-                            "dte": dte,
-                            "strike": strike,
-                            "bid": bid,
-                            "ask": ask,
-                            "last": last,
-                            "mark": mark,
-                            "delta": _safe_float(contract.get("delta")),
-                            "gamma": _safe_float(contract.get("gamma")),
-                            "theta": _safe_float(contract.get("theta")),
-                            "vega": _safe_float(contract.get("vega")),
-                            "iv": _safe_float(contract.get("volatility"), default=_safe_float(contract.get("iv"))),
-                            "open_interest": _safe_float(contract.get("openInterest")),
-                            "volume": _safe_float(contract.get("totalVolume"), default=_safe_float(contract.get("volume"))),
-                        }
+                c_get = contract.get
+                symbol[i] = c_get("symbol")
+                append_row(
+                    (
+                        c_get("bid"),
+                        c_get("ask"),
+                        c_get("last"),
+                        c_get("mark"),
+                        c_get("delta"),
+                        c_get("gamma"),
+                        c_get("theta"),
+                        c_get("vega"),
+                        c_get("volatility"),
+                        c_get("iv"),
+                        c_get("openInterest"),
+                        c_get("totalVolume"),
+                        c_get("volume"),
                     )
-    return rows
+                )
+                i += 1
+            if i > start:
+                # Side/expiry/strike are constant within a strike group: fill them as one slice.
+                side[start:i] = side_code
+                expiry_col[start:i] = expiry
+                dte_col[start:i] = dte
+                strike_col[start:i] = _safe_float(strike_key)
+
+    (
+        bid_col,
+        ask_col,
+        last_col,
+        mark_col,
+        delta_col,
+        gamma_col,
+        theta_col,
+        vega_col,
+        iv_col,
+        iv_alt,
+        oi_col,
+        volume_col,
+        volume_alt,
+    ) = _coerce_float_matrix(raw_rows, len(_RAW_FIELDS))
+
+    # Resolve per-field fallbacks before zero-filling the remaining NaN/inf values.
+    for column in (bid_col, ask_col, iv_alt, volume_alt, last_col, delta_col, gamma_col, theta_col, vega_col, oi_col):
+        np.nan_to_num(column, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+    mid = np.where((bid_col > 0) & (ask_col > 0), (bid_col + ask_col) / 2, 0.0)
+    floats = {
+        "strike": strike_col,
+        "bid": bid_col,
+        "ask": ask_col,
+        "last": last_col,
+        "mark": np.where(np.isfinite(mark_col), mark_col, mid),
+        "delta": delta_col,
+        "gamma": gamma_col,
+        "theta": theta_col,
+        "vega": vega_col,
+        "iv": np.where(np.isfinite(iv_col), iv_col, iv_alt),
+        "open_interest": oi_col,
+        "volume": np.where(np.isfinite(volume_col), volume_col, volume_alt),
+    }
+
+    return ChainTable(side=side, symbol=symbol, expiry=expiry_col, dte=dte_col, **floats)
 
 
-def _group_top_levels(gex_by_strike: Dict[float, float], *, top_n: int = 8) -> List[Dict[str, Any]]:
-    ranked = sorted(gex_by_strike.items(), key=lambda kv: abs(kv[1]), reverse=True)[:top_n]
+def _top_k_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest values, ordered like sorted(..., reverse=True)[:k] (ties keep input order)."""
+    n = values.size
+    if n > k:
+        # O(n) selection of the k-th largest value; keep every tie so the stable sort below matches sorted().
+        kth = np.argpartition(values, n - k)[n - k]
+        candidates = np.flatnonzero(values >= values[kth])
+    else:
+        candidates = np.arange(n)
+    return candidates[np.argsort(-values[candidates], kind="stable")][:k]
+
+
+def _group_top_levels(strikes: np.ndarray, gex_by_strike: np.ndarray, *, top_n: int = 8) -> List[Dict[str, Any]]:
     out: List[Dict[str, Any]] = []
-    for strike, gex in ranked:
+    for i in _top_k_indices(np.abs(gex_by_strike), top_n).tolist():
+        strike = float(strikes[i])
+        gex = float(gex_by_strike[i])
         out.append(
             {
                 "strike": round(strike, 2),
@@ -102,51 +290,108 @@ def _group_top_levels(gex_by_strike: Dict[float, float], *, top_n: int = 8) -> L
     return out
 
 
-def _call_put_summary(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
-    call_oi = sum(r["open_interest"] for r in rows if r["side"] == "CALL")
-    put_oi = sum(r["open_interest"] for r in rows if r["side"] == "PUT")
-    call_volume = sum(r["volume"] for r in rows if r["side"] == "CALL")
-    put_volume = sum(r["volume"] for r in rows if r["side"] == "PUT")
+def _masked_abs_mean(values: np.ndarray, mask: np.ndarray) -> float | None:
+    selected = values[mask]
+    if not selected.size:
+        return None
+    return float(np.abs(selected).mean())
+
+
+def _call_put_summary(table: ChainTable) -> Dict[str, Any]:
+    is_call = table.side == SIDE_CALL
+    is_put = ~is_call
+    oi = table.open_interest
+    volume = table.volume
+    call_oi = float(oi[is_call].sum())
+    put_oi = float(oi[is_put].sum())
+    call_volume = float(volume[is_call].sum())
+    put_volume = float(volume[is_put].sum())
 
-    iv_values = [r["iv"] for r in rows if r["iv"] > 0]
-    delta_values = [r["delta"] for r in rows if r["delta"] != 0]
-    gamma_values = [r["gamma"] for r in rows if r["gamma"] != 0]
+    avg_iv = _masked_abs_mean(table.iv, table.iv > 0)
+    avg_abs_delta = _masked_abs_mean(table.delta, table.delta != 0)
+    avg_abs_gamma = _masked_abs_mean(table.gamma, table.gamma != 0)
 
     return {
-        "contracts": len(rows),
+        "contracts": len(table),
         "call_open_interest": int(call_oi),
         "put_open_interest": int(put_oi),
         "call_volume": int(call_volume),
         "put_volume": int(put_volume),
         "put_call_oi_ratio": round(put_oi / call_oi, 4) if call_oi > 0 else None,
         "put_call_volume_ratio": round(put_volume / call_volume, 4) if call_volume > 0 else None,
-        "avg_iv": round(sum(iv_values) / len(iv_values), 4) if iv_values else None,
-        "avg_abs_delta": round(sum(abs(v) for v in delta_values) / len(delta_values), 4) if delta_values else None,
-        "avg_abs_gamma": round(sum(abs(v) for v in gamma_values) / len(gamma_values), 6) if gamma_values else None,
+        "avg_iv": round(avg_iv, 4) if avg_iv is not None else None,
+        "avg_abs_delta": round(avg_abs_delta, 4) if avg_abs_delta is not None else None,
+        "avg_abs_gamma": round(avg_abs_gamma, 6) if avg_abs_gamma is not None else None,
     }
 
 
-def _compute_gex(rows: List[Dict[str, Any]], spot_price: float) -> Dict[str, Any]:
-    gex_by_strike: Dict[float, float] = defaultdict(float)
-    call_gex_by_strike: Dict[float, float] = defaultdict(float)
-    put_gex_by_strike: Dict[float, float] = defaultdict(float)
-
-    for row in rows:
-        oi = row["open_interest"]
-        gamma = row["gamma"]
-        strike = row["strike"]
-        if oi <= 0 or gamma == 0 or strike <= 0:
+@njit(cache=True)
+def _gex_strike_kernel(side, strike, gamma, oi, spot_sq):  # type: ignore[no-untyped-def]
+    # Stable sort keeps per-strike accumulation in chain order, matching the NumPy path.
+    order = np.argsort(strike, kind="mergesort")
+    n = strike.size
+    strikes = np.empty(n, dtype=np.float64)
+    net = np.zeros(n, dtype=np.float64)
+    call = np.zeros(n, dtype=np.float64)
+    put = np.zeros(n, dtype=np.float64)
+    has_call = np.zeros(n, dtype=np.bool_)
+    has_put = np.zeros(n, dtype=np.bool_)
+    k = -1
+    for j in range(n):
+        i = order[j]
+        if oi[i] <= 0 or gamma[i] == 0 or strike[i] <= 0:
             continue
-
-        raw = gamma * oi * 100 * (spot_price ** 2)
-        if row["side"] == "CALL":
-            gex_by_strike[strike] += raw
-            call_gex_by_strike[strike] += raw
+        if k < 0 or strike[i] != strikes[k]:
+            k += 1
+            strikes[k] = strike[i]
+        raw = gamma[i] * oi[i] * 100 * spot_sq
+        if side[i] == 0:
+            net[k] += raw
+            call[k] += raw
+            has_call[k] = True
         else:
-            gex_by_strike[strike] -= raw
-            put_gex_by_strike[strike] -= raw
-
-    if not gex_by_strike:
+            net[k] -= raw
+            put[k] -= raw
+            has_put[k] = True
+    m = k + 1
+    return strikes[:m], net[:m], call[:m], put[:m], has_call[:m], has_put[:m]
+
+
+def _aggregate_gex_by_strike(
+    table: ChainTable, spot_price: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return (strikes, net, call, put, has_call, has_put) per unique strike, strikes ascending."""
+    if NUMBA_AVAILABLE:
+        return _gex_strike_kernel(table.side, table.strike, table.gamma, table.open_interest, spot_price ** 2)
+
+    mask = (table.open_interest > 0) & (table.gamma != 0) & (table.strike > 0)
+    strike = table.strike[mask]
+    if not strike.size:
+        empty = np.empty(0, dtype=np.float64)
+        no_side = np.empty(0, dtype=np.bool_)
+        return empty, empty, empty, empty, no_side, no_side
+
+    # Sort once, then reduce contiguous strike segments instead of hashing per contract.
+    order = np.argsort(strike, kind="stable")
+    sorted_strikes = strike[order]
+    is_call = (table.side[mask] == SIDE_CALL)[order]
+    raw = (table.gamma[mask] * table.open_interest[mask] * 100 * (spot_price ** 2))[order]
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(sorted_strikes)) + 1))
+
+    strikes = sorted_strikes[starts]
+    net = np.add.reduceat(np.where(is_call, raw, -raw), starts)
+    call = np.add.reduceat(np.where(is_call, raw, 0.0), starts)
+    put = np.add.reduceat(np.where(is_call, 0.0, -raw), starts)
+    has_call = np.logical_or.reduceat(is_call, starts)
+    has_put = np.logical_or.reduceat(~is_call, starts)
+    return strikes, net, call, put, has_call, has_put
+
+
+def _compute_gex(table: ChainTable, spot_price: float) -> Dict[str, Any]:
+    strikes, gex_by_strike, call_gex_by_strike, put_gex_by_strike, has_call, has_put = _aggregate_gex_by_strike(
+        table, spot_price
+    )
+    if not strikes.size:
         return {
             "pin": None,
             "distance_to_pin": None,
@@ -159,18 +404,16 @@ def _compute_gex(rows: List[Dict[str, Any]], spot_price: float) -> Dict[str, Any
         }
 
     # Proximity-weighted pin selection.
-    def score(strike: float, gex: float) -> float:
-        distance_pct = abs(strike - spot_price) / max(spot_price, 1.0)
-        return gex / (distance_pct ** 5 + 1e-12)
-
-    positive_levels = [(s, g) for s, g in gex_by_strike.items() if g > 0]
-    if positive_levels:
-        pin_strike = max(positive_levels, key=lambda x: score(x[0], x[1]))[0]
+    positive = gex_by_strike > 0
+    if positive.any():
+        distance_pct = np.abs(strikes[positive] - spot_price) / max(spot_price, 1.0)
+        scores = gex_by_strike[positive] / (distance_pct ** 5 + 1e-12)
+        pin_strike = float(strikes[positive][np.argmax(scores)])
     else:
-        pin_strike = max(gex_by_strike.items(), key=lambda x: abs(x[1]))[0]
+        pin_strike = float(strikes[np.argmax(np.abs(gex_by_strike))])
 
-    call_wall = max(call_gex_by_strike.items(), key=lambda x: x[1])[0] if call_gex_by_strike else None
-    put_wall = min(put_gex_by_strike.items(), key=lambda x: x[1])[0] if put_gex_by_strike else None
+    call_wall = float(strikes[has_call][np.argmax(call_gex_by_strike[has_call])]) if has_call.any() else None
+    put_wall = float(strikes[has_put][np.argmin(put_gex_by_strike[has_put])]) if has_put.any() else None
 
     distance = spot_price - pin_strike
     if abs(distance) <= 6:
@@ -180,7 +423,7 @@ def _compute_gex(rows: List[Dict[str, Any]], spot_price: float) -> Dict[str, Any
     else:
         bias = "BULLISH_REVERSION"
 
-    net_gex = sum(gex_by_strike.values())
+    net_gex = float(gex_by_strike.sum())
     return {
         "pin": round(pin_strike, 2),
         "distance_to_pin": round(distance, 2),
@@ -189,7 +432,7 @@ def _compute_gex(rows: List[Dict[str, Any]], spot_price: float) -> Dict[str, Any
         "net_gex_billion": round(net_gex / 1_000_000_000, 3),
         "call_wall": round(call_wall, 2) if call_wall is not None else None,
         "put_wall": round(put_wall, 2) if put_wall is not None else None,
-        "top_levels": _group_top_levels(gex_by_strike),
+        "top_levels": _group_top_levels(strikes, gex_by_strike),
     }
 
 
@@ -223,6 +466,103 @@ def _build_signal_summary(gex_section: Dict[str, Any], options_summary: Dict[str
     }
 
 
+def _contract_to_card(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "symbol": row.get("symbol"),
+        "side": row["side"],
+        "expiry": row["expiry"],
+        "strike": row["strike"],
+        "volume": int(row["volume"]),
+        "open_interest": int(row["open_interest"]),
+        "iv": row["iv"],
+        "delta": row["delta"],
+        "gamma": row["gamma"],
+        "mark": row["mark"],
+    }
+
+
+def _analyze_option_chain(option_chain: Dict[str, Any], spot: float) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    table = flatten_option_chain(option_chain)
+    options_summary = _call_put_summary(table)
+    gex_section = _compute_gex(table, spot_price=spot if spot > 0 else 1.0)
+    signal_summary = _build_signal_summary(gex_section, options_summary, spot=spot)
+
+    expiries = sorted(set(expiry for expiry in table.expiry.tolist() if expiry))
+    nearest_expiries = expiries[:5]
+
+    # Only the selected contracts are materialized as row dicts.
+    top_volume = table.as_rows(_top_k_indices(table.volume, 10))
+    top_oi = table.as_rows(_top_k_indices(table.open_interest, 10))
+
+    options_section = {
+        "summary": options_summary,
+        "nearest_expiries": nearest_expiries,
+        "top_volume_contracts": [_contract_to_card(x) for x in top_volume],
+        "top_open_interest_contracts": [_contract_to_card(x) for x in top_oi],
+        "raw_contract_count": len(table),
+    }
+    return options_section, gex_section, signal_summary
+
+
+_ANALYSIS_CACHE_SIZE = 16
+_analysis_cache: "OrderedDict[Tuple[Any, ...], Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]]" = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+
+def _chain_fingerprint(option_chain: Dict[str, Any], spot: float) -> Tuple[Any, ...] | None:
+    """
+    Cheap identity for a chain payload, or None when it carries no freshness marker.
+
+    Greeks and OI move intraday under an unchanged strike layout, so a chain is only
+    considered identical when Schwab's own update/quote timestamp matches too.
+    """
+    underlying = option_chain.get("underlying")
+    underlying = underlying if isinstance(underlying, dict) else {}
+    stamp = option_chain.get("updated") or underlying.get("quoteTime") or underlying.get("tradeTime")
+    if not stamp:
+        return None
+
+    expiry_keys: List[Tuple[str, ...]] = []
+    for _, map_key in _CHAIN_SIDES:
+        side_map = option_chain.get(map_key)
+        expiry_keys.append(tuple(side_map) if isinstance(side_map, dict) else ())
+    key = (
+        option_chain.get("symbol"),
+        option_chain.get("numberOfContracts"),
+        option_chain.get("underlyingPrice"),
+        stamp,
+        *expiry_keys,
+        spot,
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _analyze_option_chain_cached(
+    option_chain: Dict[str, Any], spot: float
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    key = _chain_fingerprint(option_chain, spot)
+    if key is None:
+        return _analyze_option_chain(option_chain, spot)
+
+    with _analysis_cache_lock:
+        cached = _analysis_cache.get(key)
+        if cached is not None:
+            _analysis_cache.move_to_end(key)
+            return cached
+
+    result = _analyze_option_chain(option_chain, spot)
+    with _analysis_cache_lock:
+        _analysis_cache[key] = result
+        _analysis_cache.move_to_end(key)
+        while len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+    return result
+
+
 def build_dashboard_snapshot(
     *,
     index_code: str,
@@ -235,30 +575,8 @@ def build_dashboard_snapshot(
     spot = extract_quote_price(index_quote) or 0.0
     vix = extract_quote_price(vix_quote or {}) if vix_quote else None
 
-    rows = flatten_option_chain(option_chain)
-    options_summary = _call_put_summary(rows)
-    gex_section = _compute_gex(rows, spot_price=spot if spot > 0 else 1.0)
-    signal_summary = _build_signal_summary(gex_section, options_summary, spot=spot)
-
-    expiries = sorted(set(r["expiry"] for r in rows if r.get("expiry")))
-    nearest_expiries = expiries[:5]
-
-    top_volume = sorted(rows, key=lambda x: x["volume"], reverse=True)[:10]
-    top_oi = sorted(rows, key=lambda x: x["open_interest"], reverse=True)[:10]
-
-    def contract_to_card(row: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "symbol": row.get("symbol"),
-            "side": row["side"],
-            "expiry": row["expiry"],
-            "strike": row["strike"],
-            "volume": int(row["volume"]),
-            "open_interest": int(row["open_interest"]),
-            "iv": row["iv"],
-            "delta": row["delta"],
-            "gamma": row["gamma"],
-            "mark": row["mark"],
-        }
+    # Cached sections may be shared between snapshots; copy the top level only.
+    options_section, gex_section, signal_summary = _analyze_option_chain_cached(option_chain, spot)
 
     return {
         "timestamp_utc": generated_at.astimezone(dt.timezone.utc).isoformat(),
@@ -270,13 +588,7 @@ def build_dashboard_snapshot(
             "quote": index_quote,
             "vix_quote": vix_quote,
         },
-        "options": {
-            "summary": options_summary,
-            "nearest_expiries": nearest_expiries,
-            "top_volume_contracts": [contract_to_card(x) for x in top_volume],
-            "top_open_interest_contracts": [contract_to_card(x) for x in top_oi],
-            "raw_contract_count": len(rows),
-        },
-        "gex": gex_section,
-        "signals": signal_summary,
+        "options": dict(options_section),
+        "gex": dict(gex_section),
+        "signals": dict(signal_summary),
     }
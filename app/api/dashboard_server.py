@@ -1,34 +1,103 @@
 from __future__ import annotations
 
-import json
+import gzip
+import hashlib
+import time
+from dataclasses import dataclass
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
+from app.common.jsonutil import dumps_bytes
 from app.services import MarketSnapshotService
 
 
+# JSON bodies below this size are not worth the gzip round trip.
+GZIP_MIN_BYTES = 1024
+
+# /api/health is polled aggressively; reuse its encoded body for this long.
+HEALTH_CACHE_SECONDS = 1.0
+
+_PAGE_MISSING_BYTES = dumps_bytes({"error": "Dashboard page is missing."})
+
+
+@dataclass(frozen=True)
+class StaticAsset:
+    content_type: str
+    data: bytes
+    gzipped: bytes
+    etag: str
+
+    @classmethod
+    def load(cls, file_path: Path, content_type: str) -> "StaticAsset | None":
+        if not file_path.exists():
+            return None
+        data = file_path.read_bytes()
+        return cls(
+            content_type=content_type,
+            data=data,
+            gzipped=gzip.compress(data, compresslevel=6),
+            etag=f'"{hashlib.sha1(data).hexdigest()}"',
+        )
+
+
 class DashboardRequestHandler(BaseHTTPRequestHandler):
     service: MarketSnapshotService
     dashboard_root: Path
+    index_page: StaticAsset | None = None
+    # (expires_at_monotonic, encoded body); replaced wholesale so readers never see a torn pair.
+    health_cache: tuple[float, bytes] = (0.0, b"")
 
     server_version = "GammaDashboard/1.0"
 
+    def _accepts_gzip(self) -> bool:
+        for part in self.headers.get("Accept-Encoding", "").split(","):
+            coding, _, params = part.partition(";")
+            if coding.strip().lower() not in {"gzip", "*"}:
+                continue
+            quality = params.replace(" ", "").lower()
+            if not quality.startswith("q="):
+                return True
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+        return False
+
     def _write_json(self, payload: Any, status: int = HTTPStatus.OK) -> None:
-        encoded = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self._write_encoded_json(dumps_bytes(payload), status)
+
+    def _write_encoded_json(self, encoded: bytes, status: int = HTTPStatus.OK) -> None:
+        use_gzip = len(encoded) >= GZIP_MIN_BYTES and self._accepts_gzip()
+        if use_gzip:
+            encoded = gzip.compress(encoded, compresslevel=4)
         self.send_response(status)
         self.send_header("Content-Type", "application/json; charset=utf-8")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Vary", "Accept-Encoding")
         self.send_header("Content-Length", str(len(encoded)))
         self.send_header("Cache-Control", "no-store")
         self.end_headers()
         self.wfile.write(encoded)
 
-    def _write_file(self, file_path: Path, content_type: str, status: int = HTTPStatus.OK) -> None:
-        data = file_path.read_bytes()
+    def _write_asset(self, asset: StaticAsset, status: int = HTTPStatus.OK) -> None:
+        if self.headers.get("If-None-Match") == asset.etag:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", asset.etag)
+            self.end_headers()
+            return
+
+        use_gzip = self._accepts_gzip()
+        data = asset.gzipped if use_gzip else asset.data
         self.send_response(status)
-        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Type", asset.content_type)
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("ETag", asset.etag)
         self.send_header("Content-Length", str(len(data)))
         self.end_headers()
         self.wfile.write(data)
@@ -39,11 +108,10 @@ class DashboardRequestHandler(BaseHTTPRequestHandler):
         query = parse_qs(parsed.query)
 
         if route in {"/", "/index.html"}:
-            index_file = self.dashboard_root / "index.html"
-            if not index_file.exists():
-                self._write_json({"error": "Dashboard page is missing."}, status=HTTPStatus.NOT_FOUND)
+            if self.index_page is None:
+                self._write_encoded_json(_PAGE_MISSING_BYTES, status=HTTPStatus.NOT_FOUND)
                 return
-            self._write_file(index_file, "text/html; charset=utf-8")
+            self._write_asset(self.index_page)
             return
 
         if route == "/favicon.ico":
@@ -52,13 +120,17 @@ class DashboardRequestHandler(BaseHTTPRequestHandler):
             return
 
         if route == "/api/health":
-            self._write_json(self.service.health())
+            expires_at, encoded = self.health_cache
+            now = time.monotonic()
+            if now >= expires_at:
+                encoded = dumps_bytes(self.service.health())
+                type(self).health_cache = (now + HEALTH_CACHE_SECONDS, encoded)
+            self._write_encoded_json(encoded)
             return
 
         if route == "/api/dashboard/snapshot":
             index_code = (query.get("index", ["SPX"])[0] or "SPX").upper()
-            payload = self.service.get_snapshot(index_code)
-            self._write_json(payload)
+            self._write_encoded_json(self.service.get_snapshot_json(index_code))
             return
 
         if route == "/api/dashboard/history":
@@ -99,4 +171,6 @@ def create_dashboard_server(
 
     Handler.service = service
     Handler.dashboard_root = dashboard_root
+    # Read and precompress the page once; restart the server to pick up edits.
+    Handler.index_page = StaticAsset.load(dashboard_root / "index.html", "text/html; charset=utf-8")
     return ThreadingHTTPServer((host, port), Handler)
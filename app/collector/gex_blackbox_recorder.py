@@ -1,23 +1,84 @@
 from __future__ import annotations
 
+import importlib.util
 import os
 import subprocess
 import sys
+import traceback
 from pathlib import Path
+from types import ModuleType
 
 from app.common.compat import ensure_legacy_root_gamma
 from app.config.runtime import load_dotenv
 
 
+LEGACY_MODULE_NAME = "gex_blackbox_recorder"
+
+
+def _exit_code(code: object) -> int:
+    # Same mapping the interpreter applies to an uncaught SystemExit.
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _load_legacy_module(root: Path) -> ModuleType:
+    module = sys.modules.get(LEGACY_MODULE_NAME)
+    if module is not None:
+        return module
+    script = root / f"{LEGACY_MODULE_NAME}.py"
+    spec = importlib.util.spec_from_file_location(LEGACY_MODULE_NAME, script)
+    if spec is None or spec.loader is None or not script.exists():
+        raise ImportError(f"Legacy recorder not found: {script}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[LEGACY_MODULE_NAME] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(LEGACY_MODULE_NAME, None)
+        raise
+    return module
+
+
+def _run_in_process(root: Path, args: list[str]) -> int | None:
+    """Run the legacy recorder here; None only when its module cannot be loaded."""
+    if str(root) not in sys.path:
+        sys.path.insert(0, str(root))
+    saved_argv = sys.argv
+    sys.argv = [str(root / f"{LEGACY_MODULE_NAME}.py"), *args]
+    try:
+        try:
+            legacy = _load_legacy_module(root)
+        except ImportError:
+            return None
+        # An ImportError from here on is a recorder failure, not a reason to run it again.
+        legacy.main()
+    except SystemExit as exc:
+        return _exit_code(exc.code)
+    except Exception:
+        # A child interpreter would print the traceback and exit with status 1.
+        traceback.print_exc()
+        return 1
+    finally:
+        sys.argv = saved_argv
+    return 0
+
+
 def main(argv: list[str] | None = None) -> int:
     args = argv if argv is not None else sys.argv[1:]
     load_dotenv()
     root = Path(__file__).resolve().parents[2]
     ensure_legacy_root_gamma(root)
-    env = os.environ.copy()
-    env.setdefault("PYTHONIOENCODING", "utf-8")
-    env.setdefault("PYTHONUTF8", "1")
-    return subprocess.call([sys.executable, str(root / "gex_blackbox_recorder.py"), *args], env=env)
+    os.environ.setdefault("PYTHONIOENCODING", "utf-8")
+    os.environ.setdefault("PYTHONUTF8", "1")
+    # Run the legacy recorder in this interpreter to skip a second cold start.
+    code = _run_in_process(root, args)
+    if code is not None:
+        return code
+    return subprocess.call([sys.executable, str(root / f"{LEGACY_MODULE_NAME}.py"), *args])
 
 
 if __name__ == "__main__":
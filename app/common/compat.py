@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import argparse
 import os
 import subprocess
+import sys
 from pathlib import Path
 
 
@@ -33,3 +35,42 @@ def ensure_legacy_root_gamma(project_root: Path) -> bool:
     except Exception:
         return False
 
+
+MIN_INTERVAL_SECONDS = 5
+
+
+def interval_seconds(raw: str) -> int:
+    """argparse `type=` for refresh/poll intervals; rejects values below MIN_INTERVAL_SECONDS."""
+    try:
+        value = int(raw)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {raw!r}") from None
+    if value < MIN_INTERVAL_SECONDS:
+        raise argparse.ArgumentTypeError(f"must be >= {MIN_INTERVAL_SECONDS} seconds")
+    return value
+
+
+def run_python_script(script: Path, args: list[str]) -> int:
+    """
+    Run `script` with this interpreter and return its exit status.
+
+    On POSIX the current process is replaced (os.execv never returns), so a thin
+    launcher does not stay resident next to the child. Windows has no real exec:
+    os.execv there spawns a detached child and exits, losing the exit code and
+    Ctrl+C, so it waits on a subprocess instead.
+    """
+    argv = [sys.executable, str(script), *args]
+    if os.name == "nt":
+        return subprocess.call(argv)
+    # Anything still buffered would be discarded with the old process image.
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execv(sys.executable, argv)
+    return 0  # Unreachable; os.execv raises OSError on failure.
+
+
+def disabled_entrypoint(script: str, removed: str, replacement: str = "run_dashboard.py") -> int:
+    """Explain that a retired entrypoint no longer runs; returns the exit status."""
+    print(f"{script} is disabled: {removed} was removed.")
+    print(f"Use: python {replacement}")
+    return 1
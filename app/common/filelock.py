@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import os
+import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import IO, Iterator
+from typing import IO, Any, Iterator
 
 
 IS_WINDOWS = os.name == "nt"
@@ -14,7 +15,12 @@ else:
     import fcntl
 
 
-def lock_stream(stream: IO[str], *, exclusive: bool = True, blocking: bool = True) -> None:
+# Parent directories already created by locked_open in this process.
+_known_dirs: set[Path] = set()
+_known_dirs_lock = threading.Lock()
+
+
+def lock_stream(stream: IO[Any], *, exclusive: bool = True, blocking: bool = True) -> None:
     if IS_WINDOWS:
         stream.seek(0)
         if exclusive:
@@ -35,7 +41,30 @@ def lock_stream(stream: IO[str], *, exclusive: bool = True, blocking: bool = Tru
     fcntl.flock(stream.fileno(), flags)
 
 
-def unlock_stream(stream: IO[str]) -> None:
+def _ensure_parent(file_path: Path) -> None:
+    parent = file_path.parent
+    if parent in _known_dirs:
+        return
+    parent.mkdir(parents=True, exist_ok=True)
+    with _known_dirs_lock:
+        _known_dirs.add(parent)
+
+
+def _open_with_parent(file_path: Path, mode: str, encoding: str | None) -> IO[Any]:
+    _ensure_parent(file_path)
+    if "b" in mode:
+        encoding = None
+    try:
+        return open(file_path, mode, encoding=encoding)
+    except FileNotFoundError:
+        # The cached directory was removed underneath us; recreate it once.
+        with _known_dirs_lock:
+            _known_dirs.discard(file_path.parent)
+        _ensure_parent(file_path)
+        return open(file_path, mode, encoding=encoding)
+
+
+def unlock_stream(stream: IO[Any]) -> None:
     if IS_WINDOWS:
         stream.seek(0)
         msvcrt.locking(stream.fileno(), msvcrt.LK_UNLCK, 1)
@@ -51,10 +80,10 @@ def locked_open(
     exclusive: bool = True,
     blocking: bool = True,
     encoding: str = "utf-8",
-) -> Iterator[IO[str]]:
+) -> Iterator[IO[Any]]:
+    """Open `path` and hold an advisory lock on it; binary modes ignore `encoding`."""
     file_path = Path(path)
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, mode, encoding=encoding) as handle:
+    with _open_with_parent(file_path, mode, encoding) as handle:
         lock_stream(handle, exclusive=exclusive, blocking=blocking)
         try:
             yield handle
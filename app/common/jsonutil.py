@@ -0,0 +1,47 @@
+"""JSON helpers that use orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    ORJSON_AVAILABLE = False
+
+
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if ORJSON_AVAILABLE else 0
+
+# json.dumps builds a fresh JSONEncoder whenever non-default options are passed; reuse one.
+_STDLIB_ENCODE = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def dumps_bytes(payload: Any) -> bytes:
+    """Serialize `payload` to compact UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(payload, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # orjson.JSONEncodeError subclasses TypeError (e.g. >64-bit ints); retry with stdlib.
+            pass
+    return _STDLIB_ENCODE(payload).encode("utf-8")
+
+
+def dumps(payload: Any) -> str:
+    """Serialize `payload` to a compact JSON string (non-ASCII kept as-is)."""
+    return dumps_bytes(payload).decode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity literals that the stdlib parser accepts.
+            pass
+    return json.loads(data)
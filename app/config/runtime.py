@@ -2,25 +2,39 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from typing import Dict, Tuple
 
 from app.common.paths import PROJECT_ROOT
 
 
+# (mtime_ns, size) of each .env file already applied in this process.
+_LAST_LOADED: Dict[Path, Tuple[int, int]] = {}
+
+
 def load_dotenv(env_file: Path | None = None, *, override: bool = False) -> Path:
     env_path = env_file or (PROJECT_ROOT / ".env")
-    if not env_path.exists():
+    try:
+        stat = env_path.stat()
+    except FileNotFoundError:
         return env_path
 
-    for raw in env_path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = value.strip()
-        if value and value[0] == value[-1] and value[0] in {"'", '"'}:
-            value = value[1:-1]
-        if override or key not in os.environ:
-            os.environ[key] = value
-    return env_path
+    signature = (stat.st_mtime_ns, stat.st_size)
+    if not override and _LAST_LOADED.get(env_path) == signature:
+        return env_path
 
+    with env_path.open("r", encoding="utf-8") as handle:
+        for raw in handle:
+            line = raw.strip()
+            if not line or line.startswith("#"):
+                continue
+            key, sep, value = line.partition("=")
+            if not sep:
+                continue
+            key = key.strip()
+            value = value.strip()
+            if value and value[0] == value[-1] and value[0] in {"'", '"'}:
+                value = value[1:-1]
+            if override or key not in os.environ:
+                os.environ[key] = value
+    _LAST_LOADED[env_path] = signature
+    return env_path
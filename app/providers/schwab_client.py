@@ -4,16 +4,49 @@ import base64
 import os
 import threading
 import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
-from typing import Any, Dict
-from urllib.parse import urljoin
+from typing import Any, Callable, Dict, List, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.common.jsonutil import loads as json_loads
 
 
 TOKEN_URL = "https://api.schwabapi.com/v1/oauth/token"
 API_BASE_URL = "https://api.schwabapi.com"
 
+QUOTE_BATCH_WINDOW_SECONDS = 0.01
+QUOTE_CACHE_TTL_SECONDS = 2.0
+OPTION_CHAIN_CACHE_TTL_SECONDS = 5.0
+
+HTTP_POOL_CONNECTIONS = 8
+HTTP_POOL_MAXSIZE = 16
+
+
+def _build_session() -> requests.Session:
+    # Keep-alive pool sized for the multi-index fan-out. Only GETs are retried:
+    # the token POST rotates the refresh token and must not be replayed.
+    retry = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    session.headers["Accept"] = "application/json"
+    return session
+
 
 class SchwabClientError(RuntimeError):
     pass
@@ -30,6 +63,65 @@ class SchwabTokenState:
         return bool(self.access_token) and time.time() < (self.expires_at_epoch - 60.0)
 
 
+class _QuoteBatcher:
+    """
+    Coalesces concurrent quote lookups into one /quotes request.
+
+    Callers submit symbol lists; a single worker waits a short window for other
+    callers to join, requests the union of symbols, and hands every caller the
+    full response payload.
+    """
+
+    def __init__(self, fetch: Callable[[List[str]], Dict[str, Any]], *, window_seconds: float) -> None:
+        self._fetch = fetch
+        self._window_seconds = window_seconds
+        self._cond = threading.Condition()
+        self._pending: List[Tuple[List[str], Future]] = []
+        self._worker: threading.Thread | None = None
+
+    def submit(self, symbols: List[str]) -> Future:
+        future: Future = Future()
+        with self._cond:
+            self._pending.append((list(symbols), future))
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="schwab-quote-batcher", daemon=True)
+                self._worker.start()
+            self._cond.notify()
+        return future
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._cond:
+                    while not self._pending:
+                        self._cond.wait()
+                time.sleep(self._window_seconds)
+                with self._cond:
+                    batch, self._pending = self._pending, []
+
+                symbols = list(dict.fromkeys(symbol for requested, _ in batch for symbol in requested))
+                try:
+                    payload = self._fetch(symbols)
+                except Exception as exc:
+                    for _, future in batch:
+                        future.set_exception(exc)
+                    continue
+                except BaseException as exc:
+                    for _, future in batch:
+                        future.set_exception(SchwabClientError(f"Quote batcher stopped: {exc!r}"))
+                    raise
+                for _, future in batch:
+                    future.set_result(dict(payload))
+        finally:
+            # If the worker dies (SystemExit/KeyboardInterrupt in this thread), fail anyone still
+            # waiting and let the next submit() start a fresh worker instead of hanging forever.
+            with self._cond:
+                self._worker = None
+                stranded, self._pending = self._pending, []
+            for _, future in stranded:
+                future.set_exception(SchwabClientError("Quote batcher stopped"))
+
+
 class SchwabClient:
     """
     Minimal Schwab API client for market-data dashboard usage.
@@ -51,8 +143,14 @@ class SchwabClient:
         self.client_id = (client_id or os.getenv("SCHWAB_CLIENT_ID", "")).strip()
         self.client_secret = (client_secret or os.getenv("SCHWAB_CLIENT_SECRET", "")).strip()
         self.timeout_seconds = timeout_seconds
+        self._base_url = API_BASE_URL.rstrip("/")
         self._lock = threading.Lock()
-        self._session = requests.Session()
+        self._session = _build_session()
+        self._cache_lock = threading.Lock()
+        self._response_cache: Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = {}
+        self._quote_batcher = _QuoteBatcher(self.get_quotes, window_seconds=QUOTE_BATCH_WINDOW_SECONDS)
+        # Upper bound for one batch: a token refresh plus the quotes GET and its two retries.
+        self._quote_batch_timeout = QUOTE_BATCH_WINDOW_SECONDS + 4 * timeout_seconds
         self._token = SchwabTokenState(
             access_token=(access_token or os.getenv("SCHWAB_ACCESS_TOKEN", "")).strip(),
             refresh_token=(refresh_token or os.getenv("SCHWAB_REFRESH_TOKEN", "")).strip(),
@@ -88,7 +186,7 @@ class SchwabClient:
                 f"Schwab token refresh failed: HTTP {response.status_code} - {response.text[:300]}"
             )
 
-        payload = response.json()
+        payload = json_loads(response.content)
         access_token = (payload.get("access_token") or payload.get("token") or "").strip()
         if not access_token:
             raise SchwabClientError("Schwab token refresh response missing access token.")
@@ -113,6 +211,15 @@ class SchwabClient:
             self._refresh_access_token()
             return self._token.access_token
 
+    def warm_up(self) -> None:
+        """Fetch a token if needed and open a pooled connection before the first data request."""
+        try:
+            self.get_access_token()
+            self._session.head(self._base_url, timeout=self.timeout_seconds)
+        except (requests.RequestException, SchwabClientError):
+            # The first real request reports auth/network problems with full context.
+            pass
+
     def _request(
         self,
         method: str,
@@ -120,11 +227,20 @@ class SchwabClient:
         *,
         params: Dict[str, Any] | None = None,
         json_payload: Dict[str, Any] | None = None,
+        cache_ttl: float = 0.0,
     ) -> Dict[str, Any]:
-        url = urljoin(API_BASE_URL, path)
+        cache_key: Tuple[Any, ...] | None = None
+        if cache_ttl > 0 and method == "GET" and json_payload is None:
+            cache_key = (method, path, tuple(sorted((params or {}).items())))
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        url = self._base_url + path if path.startswith("/") else f"{self._base_url}/{path}"
 
         token = self.get_access_token()
-        headers = {"Authorization": f"Bearer {token}", "Accept": "application/json"}
+        # Accept/Accept-Encoding live on the session; only the bearer token varies per call.
+        headers = {"Authorization": f"Bearer {token}"}
 
         response = self._session.request(
             method=method,
@@ -150,15 +266,44 @@ class SchwabClient:
         if response.status_code >= 400:
             raise SchwabClientError(f"Schwab API error {response.status_code}: {response.text[:400]}")
 
-        if not response.content:
-            return {}
-        return response.json()
+        payload = json_loads(response.content) if response.content else {}
+        if cache_key is not None:
+            self._cache_put(cache_key, payload, cache_ttl)
+        return payload
 
-    def get_quotes(self, symbols: list[str]) -> Dict[str, Any]:
+    def _cache_get(self, key: Tuple[Any, ...]) -> Dict[str, Any] | None:
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._response_cache[key]
+                return None
+            return entry[1]
+
+    def _cache_put(self, key: Tuple[Any, ...], payload: Dict[str, Any], ttl: float) -> None:
+        now = time.monotonic()
+        with self._cache_lock:
+            expired = [item for item, (expires_at, _) in self._response_cache.items() if expires_at <= now]
+            for item in expired:
+                del self._response_cache[item]
+            self._response_cache[key] = (now + ttl, payload)
+
+    # Cached payloads are shared between callers and must be treated as read-only.
+    def get_quotes(self, symbols: list[str], *, ttl: float = QUOTE_CACHE_TTL_SECONDS) -> Dict[str, Any]:
         if not symbols:
             return {}
         joined_symbols = ",".join(symbols)
-        return self._request("GET", "/marketdata/v1/quotes", params={"symbols": joined_symbols})
+        return self._request("GET", "/marketdata/v1/quotes", params={"symbols": joined_symbols}, cache_ttl=ttl)
+
+    def get_quotes_batched(self, symbols: list[str]) -> Dict[str, Any]:
+        """Like get_quotes, but shares one request with concurrent callers (payload may hold extra symbols)."""
+        if not symbols:
+            return {}
+        try:
+            return self._quote_batcher.submit(symbols).result(timeout=self._quote_batch_timeout)
+        except FutureTimeoutError as exc:
+            raise SchwabClientError(f"Quote request timed out after {self._quote_batch_timeout:.0f}s") from exc
 
     def get_option_chain(
         self,
@@ -168,6 +313,7 @@ class SchwabClient:
         strike_count: int = 60,
         include_quotes: bool = True,
         strategy: str = "SINGLE",
+        ttl: float = OPTION_CHAIN_CACHE_TTL_SECONDS,
     ) -> Dict[str, Any]:
         params: Dict[str, Any] = {
             "symbol": symbol,
@@ -176,7 +322,7 @@ class SchwabClient:
             "includeQuotes": str(include_quotes).lower(),
             "strategy": strategy,
         }
-        return self._request("GET", "/marketdata/v1/chains", params=params)
+        return self._request("GET", "/marketdata/v1/chains", params=params, cache_ttl=ttl)
 
     def get_accounts_numbers(self) -> Dict[str, Any]:
         return self._request("GET", "/trader/v1/accounts/accountNumbers")
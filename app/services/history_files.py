@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import io
+import os
+import struct
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator
+
+from app.common.jsonutil import dumps_bytes, loads as json_loads
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None  # type: ignore[assignment]
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+    ZSTD_AVAILABLE = False
+
+
+HISTORY_FORMAT_JSONL = "jsonl"
+HISTORY_FORMAT_MSGPACK = "msgpack"
+HISTORY_FORMATS = (HISTORY_FORMAT_JSONL, HISTORY_FORMAT_MSGPACK)
+
+# msgpack records are framed with a 4-byte big-endian length so files can be appended to and streamed.
+_FRAME_HEADER = struct.Struct(">I")
+
+ZSTD_SUFFIX = ".zst"
+ZSTD_LEVEL = 10
+
+
+def resolve_history_format(requested: str | None) -> str:
+    """Normalize a requested format, falling back to JSONL when msgpack is unavailable."""
+    fmt = (requested or HISTORY_FORMAT_JSONL).strip().lower()
+    if fmt == HISTORY_FORMAT_MSGPACK and MSGPACK_AVAILABLE:
+        return HISTORY_FORMAT_MSGPACK
+    return HISTORY_FORMAT_JSONL
+
+
+def _msgpack_default(value: Any) -> Any:
+    # NumPy scalars (e.g. int64 counts) are not native msgpack types.
+    item = getattr(value, "item", None)
+    if callable(item):
+        return item()
+    raise TypeError(f"Cannot serialize {type(value).__name__} to msgpack")
+
+
+def encode_history_record(snapshot: Dict[str, Any], fmt: str) -> bytes:
+    if fmt == HISTORY_FORMAT_MSGPACK:
+        body = msgpack.packb(snapshot, use_bin_type=True, default=_msgpack_default)
+        return _FRAME_HEADER.pack(len(body)) + body
+    return dumps_bytes(snapshot) + b"\n"
+
+
+def compress_history_file(path: Path, *, level: int = ZSTD_LEVEL) -> Path | None:
+    """
+    Compress a finished history file to `<path>.zst` and remove the original.
+
+    Returns the compressed path, or None when zstandard is unavailable, the
+    source is gone, or a .zst for it already exists. An existing archive is
+    never replaced; the original is then left uncompressed. The output is
+    written to a temp name first so a crash never leaves a partial .zst next
+    to the original.
+    """
+    if not ZSTD_AVAILABLE or not path.exists():
+        return None
+    target = path.with_name(path.name + ZSTD_SUFFIX)
+    if target.exists():
+        return None
+    temp = target.with_name(target.name + ".tmp")
+    compressor = zstandard.ZstdCompressor(level=level)
+    with open(path, "rb") as source, open(temp, "wb") as sink:
+        compressor.copy_stream(source, sink)
+    os.replace(temp, target)
+    path.unlink()
+    return target
+
+
+def _iter_msgpack_frames(handle: IO[bytes]) -> Iterator[Dict[str, Any]]:
+    while True:
+        header = handle.read(_FRAME_HEADER.size)
+        if len(header) < _FRAME_HEADER.size:
+            return
+        (size,) = _FRAME_HEADER.unpack(header)
+        body = handle.read(size)
+        if len(body) < size:
+            return  # Truncated tail from an interrupted write.
+        yield msgpack.unpackb(body, raw=False, strict_map_key=False)
+
+
+def _iter_jsonl_lines(handle: IO[bytes]) -> Iterator[Dict[str, Any]]:
+    for line in handle:
+        line = line.strip()
+        if line:
+            yield json_loads(line)
+
+
+def iter_history_file(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield snapshots from a history file; format and compression are taken from the suffixes."""
+    compressed = path.suffix == ZSTD_SUFFIX
+    inner = path.with_suffix("") if compressed else path
+    if compressed and not ZSTD_AVAILABLE:
+        raise RuntimeError(f"zstandard is required to read {path}")
+    is_msgpack = inner.suffix == f".{HISTORY_FORMAT_MSGPACK}"
+    if is_msgpack and not MSGPACK_AVAILABLE:
+        raise RuntimeError(f"msgpack is required to read {path}")
+
+    with open(path, "rb") as raw:
+        if compressed:
+            # Buffered so framed reads and line iteration behave like a plain file.
+            handle: IO[bytes] = io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(raw))
+        else:
+            handle = raw
+        if is_msgpack:
+            yield from _iter_msgpack_frames(handle)
+        else:
+            yield from _iter_jsonl_lines(handle)
@@ -1,21 +1,35 @@
 from __future__ import annotations
 
+import atexit
 import datetime as dt
-import json
+import heapq
+import itertools
 import logging
+import logging.handlers
+import os
+import queue
 import threading
 import time
-from copy import deepcopy
-from collections import deque
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from collections import defaultdict, deque
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Deque, Dict, List
+from typing import Any, Deque, Dict, List, Tuple
 
 from app.analytics import build_dashboard_snapshot
 from app.common.filelock import locked_open
+from app.common.jsonutil import dumps as json_dumps, dumps_bytes
 from app.common.paths import data_path
+from app.services.history_files import (
+    HISTORY_FORMAT_JSONL,
+    ZSTD_AVAILABLE,
+    compress_history_file,
+    encode_history_record,
+    resolve_history_format,
+)
 from app.providers import SchwabClient, SchwabClientError
-from app.signals import build_dashboard_strategy
+from app.signals import build_dashboard_strategy, collect_extended_metrics
 from index_config import get_index_config
 
 
@@ -26,6 +40,20 @@ INDEX_SYMBOL_MAP: Dict[str, str] = {
 
 VIX_SYMBOL = "$VIX"
 
+MEMORY_HISTORY_SIZE = 500
+# Debug rule stats cover this many of the most recent snapshots per index.
+RULE_STATS_WINDOW = 160
+HISTORY_QUEUE_SIZE = 1024
+HISTORY_WRITE_BATCH = 256
+# Event levels that are also kept in the recent-errors buffer.
+_WARN_LEVELS = frozenset(("warning", "error"))
+# Strategy action/reason values used when a strategy payload omits them.
+_ACTION_TRADE = "TRADE"
+_ACTION_NO_TRADE = "NO_TRADE"
+_DEFAULT_PRIMARY_REASON = "No primary reason."
+# O_BINARY only exists on Windows; without it the CRT would translate "\n" in msgpack frames.
+_HISTORY_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0)
+
 CHECK_LABELS: Dict[str, tuple[str, str]] = {
     "market_open_day": ("交易日", "Market Open Day"),
     "entry_cutoff": ("入场截止", "Entry Cutoff"),
@@ -47,25 +75,171 @@ CHECK_LABELS: Dict[str, tuple[str, str]] = {
 }
 
 
-@dataclass
+@lru_cache(maxsize=16)
+def _resolve_schwab_symbol(index_code: str) -> str:
+    if index_code in INDEX_SYMBOL_MAP:
+        return INDEX_SYMBOL_MAP[index_code]
+    index_cfg = get_index_config(index_code)
+    return f"${index_cfg.index_symbol}"
+
+
+@lru_cache(maxsize=64)
+def _quote_alias(symbol: str) -> str:
+    return symbol.replace("$", "")
+
+
+@lru_cache(maxsize=64)
+def _check_label(name: str) -> tuple[str, str]:
+    # Check names come from a small fixed set, so the humanized fallback is built once per name.
+    label = CHECK_LABELS.get(name)
+    if label is None:
+        human = name.replace("_", " ")
+        label = (human, human)
+    return label
+
+
+class _LazyJSON:
+    """Defers encoding a log event until a handler actually formats the record."""
+
+    __slots__ = ("payload", "_text")
+
+    def __init__(self, payload: Any) -> None:
+        self.payload = payload
+        self._text: str | None = None
+
+    def __str__(self) -> str:
+        # Warnings reach both file handlers; encode once and reuse.
+        if self._text is None:
+            self._text = json_dumps(self.payload)
+        return self._text
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves message formatting (and _LazyJSON encoding) to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock prepare() formats on the caller; our log args are never mutated after logging.
+        return record
+
+
+@dataclass(slots=True)
+class _RuleCounts:
+    seen: int = 0
+    pass_count: int = 0
+    fail_count: int = 0
+    blocking_fail_count: int = 0
+    soft_warn_count: int = 0
+
+
+def _rule_stats_order(item: Tuple[str, _RuleCounts]) -> Tuple[int, str]:
+    # Most blocking failures first, then by check name.
+    name, counts = item
+    return -counts.blocking_fail_count, name
+
+
+class _RuleStatsWindow:
+    """Rolling per-check counts over the last `size` snapshots, updated as snapshots are appended."""
+
+    __slots__ = ("_size", "_outcomes", "_totals")
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._outcomes: Deque[Tuple[Tuple[str, bool, bool], ...]] = deque()
+        self._totals: "defaultdict[str, _RuleCounts]" = defaultdict(_RuleCounts)
+
+    def add(self, checks: Dict[str, Any]) -> None:
+        entries: List[Tuple[str, bool, bool]] = []
+        for name, payload in checks.items():
+            check = payload if isinstance(payload, dict) else {}
+            entries.append((name, bool(check.get("ok")), bool(check.get("blocking", True))))
+        outcome = tuple(entries)
+        if len(self._outcomes) == self._size:
+            self._apply(self._outcomes.popleft(), -1)
+        self._outcomes.append(outcome)
+        self._apply(outcome, 1)
+
+    def _apply(self, outcome: Tuple[Tuple[str, bool, bool], ...], sign: int) -> None:
+        totals = self._totals
+        for name, ok, blocking in outcome:
+            counts = totals[name]
+            counts.seen += sign
+            if ok:
+                counts.pass_count += sign
+            elif blocking:
+                counts.fail_count += sign
+                counts.blocking_fail_count += sign
+            else:
+                counts.fail_count += sign
+                counts.soft_warn_count += sign
+            if counts.seen == 0:
+                del totals[name]
+
+    def counts(self) -> List[Tuple[str, _RuleCounts]]:
+        return [(name, replace(counts)) for name, counts in self._totals.items()]
+
+
+@dataclass(frozen=True)
 class SnapshotState:
+    # Published snapshots are never mutated: readers, history and the stale-response path share
+    # the same nested dicts, and anything that needs changes copies just the part it rewrites.
     snapshot: Dict[str, Any] | None = None
     updated_at_epoch: float = 0.0
+    # Freshness is judged on the monotonic clock; the epoch is only reported.
+    updated_at_monotonic: float = 0.0
     last_error: str | None = None
+    # Compact JSON of `snapshot`, encoded once per refresh and shared by history and the API.
+    serialized: bytes | None = None
 
 
 class MarketSnapshotService:
-    def __init__(self, *, client: SchwabClient, refresh_seconds: int = 12, strategy_fast_mode: bool = True) -> None:
+    def __init__(
+        self,
+        *,
+        client: SchwabClient,
+        refresh_seconds: int = 12,
+        strategy_fast_mode: bool = True,
+        history_format: str = HISTORY_FORMAT_JSONL,
+        history_file_lock: bool = True,
+    ) -> None:
         self.client = client
         self.refresh_seconds = max(5, int(refresh_seconds))
+        # A refresh slower than the refresh interval is reported as a warning event.
+        self._slow_threshold_ms = self.refresh_seconds * 1000.0
         self.strategy_fast_mode = bool(strategy_fast_mode)
-        self._lock = threading.Lock()
+        self.history_format = resolve_history_format(history_format)
+        # run_signal and run_dashboard may append to the same history files, and O_APPEND alone does
+        # not keep their lines whole on Windows; the lock-free cached-descriptor path is opt-in.
+        self.history_file_lock = bool(history_file_lock)
+        # Per-index state is guarded by _index_lock(); the event buffers below need no lock.
+        # Known indices are seeded up front; the guard is only taken the first time another index appears.
+        self._state_locks: Dict[str, threading.Lock] = {code: threading.Lock() for code in INDEX_SYMBOL_MAP}
+        self._state_locks_guard = threading.Lock()
         self._states: Dict[str, SnapshotState] = {}
-        self._history_cache: Dict[str, List[Dict[str, Any]]] = {}
-        self._refresh_locks: Dict[str, threading.Lock] = {}
+        self._history_cache: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._rule_windows: Dict[str, _RuleStatsWindow] = {}
+        # One shared refresh per index; concurrent callers wait on (or bypass) its Future.
+        self._inflight: Dict[str, "Future[Dict[str, Any]]"] = {}
         self._recent_events: Deque[Dict[str, Any]] = deque(maxlen=300)
         self._recent_errors: Deque[Dict[str, Any]] = deque(maxlen=120)
+        # Chain and strategy-metric fetches run here so they overlap with the quotes request.
+        self._fetch_pool = ThreadPoolExecutor(max_workers=6, thread_name_prefix="snapshot-fetch")
         self._logger = self._create_logger()
+        # History lines are appended by a background writer so refreshes never wait on the file lock.
+        self._history_queue: "queue.Queue[Tuple[str, dt.date, Path, bytes] | None]" = queue.Queue(
+            maxsize=HISTORY_QUEUE_SIZE
+        )
+        # Newest (date, path) written per index; owned by the writer thread.
+        self._active_history_paths: Dict[str, Tuple[dt.date, Path]] = {}
+        # O_APPEND descriptors kept open per history file; also owned by the writer thread.
+        self._history_fds: Dict[Path, int] = {}
+        # Latest (date, path) per index; replaced when the date changes.
+        self._history_path_cache: Dict[str, Tuple[dt.date, Path]] = {}
+        self._history_writer = threading.Thread(
+            target=self._history_writer_loop,
+            name="dashboard-history-writer",
+            daemon=True,
+        )
+        self._history_writer.start()
 
     @staticmethod
     def _create_logger() -> logging.Logger:
@@ -85,45 +259,215 @@ class MarketSnapshotService:
         error_handler.setLevel(logging.WARNING)
         error_handler.setFormatter(formatter)
 
-        logger.addHandler(success_handler)
-        logger.addHandler(error_handler)
+        # File writes happen on a listener thread; refreshes only enqueue the record.
+        records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(records, success_handler, error_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        logger.addHandler(_DeferredQueueHandler(records))
         return logger
 
     def _append_event(self, event: Dict[str, Any]) -> None:
-        with self._lock:
-            self._recent_events.append(event)
-            if event.get("level") in {"warning", "error"}:
-                self._recent_errors.append(event)
-
-    def _resolve_schwab_symbol(self, index_code: str) -> str:
-        if index_code in INDEX_SYMBOL_MAP:
-            return INDEX_SYMBOL_MAP[index_code]
-        index_cfg = get_index_config(index_code)
-        return f"${index_cfg.index_symbol}"
-
-    def _history_path(self, index_code: str, now: dt.datetime | None = None) -> Path:
-        ts = now or dt.datetime.now()
-        return data_path(f"dashboard_snapshots_{index_code.lower()}_{ts.strftime('%Y%m%d')}.jsonl")
-
-    def _write_history(self, index_code: str, snapshot: Dict[str, Any]) -> None:
-        path = self._history_path(index_code)
-        line = json.dumps(snapshot, ensure_ascii=False, separators=(",", ":"))
-        with locked_open(path, "a", exclusive=True) as handle:
-            handle.write(line + "\n")
+        # deque.append (and the maxlen eviction) is atomic under the GIL, and debug() copies each
+        # tail in a single C-level call, so neither side locks. The two buffers are not updated
+        # together: a reader may briefly see an error in one and not yet in the other.
+        self._recent_events.append(event)
+        if event.get("level") in _WARN_LEVELS:
+            self._recent_errors.append(event)
+
+    def _index_lock(self, index_code: str) -> threading.Lock:
+        # SPX and NDX refreshes/readers never contend with each other.
+        lock = self._state_locks.get(index_code)
+        if lock is None:
+            with self._state_locks_guard:
+                lock = self._state_locks.setdefault(index_code, threading.Lock())
+        return lock
+
+    def _publish_state(self, index_code: str, state: SnapshotState) -> None:
+        # States are immutable and swapped in whole, so readers can use self._states without the lock.
+        self._states[index_code] = state
+
+    def _history_target(self, index_code: str, now: dt.datetime | None = None) -> Tuple[dt.date, Path]:
+        day = (now or dt.datetime.now()).date()
+        cached = self._history_path_cache.get(index_code)
+        if cached is not None and cached[0] == day:
+            return cached
+        path = data_path(f"dashboard_snapshots_{index_code.lower()}_{day.strftime('%Y%m%d')}.{self.history_format}")
+        target = self._history_path_cache[index_code] = (day, path)
+        return target
+
+    def _write_history(
+        self,
+        index_code: str,
+        snapshot: Dict[str, Any],
+        *,
+        now: dt.datetime | None = None,
+        encoded: bytes | None = None,
+    ) -> None:
+        if encoded is not None and self.history_format == HISTORY_FORMAT_JSONL:
+            record = encoded + b"\n"
+        else:
+            record = encode_history_record(snapshot, self.history_format)
+        item = (index_code, *self._history_target(index_code, now), record)
+        try:
+            self._history_queue.put_nowait(item)
+            return
+        except queue.Full:
+            pass
+        # Writer is behind: drop the oldest pending line to keep the newest snapshot.
+        try:
+            dropped = self._history_queue.get_nowait()
+            self._history_queue.task_done()
+        except queue.Empty:
+            dropped = None
+        try:
+            self._history_queue.put_nowait(item)
+        except queue.Full:
+            dropped = item
+        if dropped is not None:
+            event = {
+                "timestamp_utc": dt.datetime.now(dt.timezone.utc).isoformat(),
+                "level": "warning",
+                "event": "history_write_dropped",
+                "index": index_code,
+                "path": str(dropped[2]),
+                "message": "History writer queue full; dropped oldest pending line.",
+            }
+            self._logger.warning("%s", _LazyJSON(event))
+            self._append_event(event)
+
+    def _history_writer_loop(self) -> None:
+        while True:
+            item = self._history_queue.get()
+            batch = [item]
+            while item is not None and len(batch) < HISTORY_WRITE_BATCH:
+                try:
+                    item = self._history_queue.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(item)
+
+            pending: Dict[Path, List[bytes]] = {}
+            late: set[Path] = set()
+            for entry in batch:
+                if entry is None:
+                    continue
+                index_code, day, path, line = entry
+                if not self._maybe_rotate_history(index_code, day, path):
+                    late.add(path)
+                pending.setdefault(path, []).append(line)
+            for path, lines in pending.items():
+                try:
+                    self._append_history_lines(path, b"".join(lines))
+                except OSError as exc:
+                    self._close_history_fd(path)
+                    self._logger.error("History write failed for %s: %s", path, exc)
+            for path in late:
+                # Late lines for an earlier day: written, but that file is not kept open.
+                self._close_history_fd(path)
+            for _ in batch:
+                self._history_queue.task_done()
+            if batch[-1] is None:
+                for path in list(self._history_fds):
+                    self._close_history_fd(path)
+                return
+
+    def _append_history_lines(self, path: Path, data: bytes) -> None:
+        if self.history_file_lock:
+            with locked_open(path, "ab", exclusive=True) as handle:
+                handle.write(data)
+            return
+        fd = self._history_fds.get(path)
+        if fd is None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = self._history_fds[path] = os.open(path, _HISTORY_OPEN_FLAGS, 0o644)
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+
+    def _close_history_fd(self, path: Path) -> None:
+        fd = self._history_fds.pop(path, None)
+        if fd is None:
+            return
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+    def _maybe_rotate_history(self, index_code: str, day: dt.date, path: Path) -> bool:
+        """Track the newest history day per index; False for a late line from an earlier day."""
+        # Called on the writer thread, so nothing else appends to the previous file once we move on.
+        previous = self._active_history_paths.get(index_code)
+        if previous is not None and day <= previous[0]:
+            # Only a move to a later day rotates; a late line must not compress the active file.
+            return day == previous[0]
+        self._active_history_paths[index_code] = (day, path)
+        if previous is None:
+            return True
+        self._close_history_fd(previous[1])
+        if ZSTD_AVAILABLE:
+            threading.Thread(
+                target=self._compress_history,
+                args=(previous[1],),
+                name="dashboard-history-compress",
+                daemon=True,
+            ).start()
+        return True
+
+    def _compress_history(self, path: Path) -> None:
+        try:
+            target = compress_history_file(path)
+        except OSError as exc:
+            self._logger.error("History compression failed for %s: %s", path, exc)
+            return
+        if target is not None:
+            self._logger.info("Compressed history %s -> %s", path.name, target.name)
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Wait until every queued history line has been written; False if the timeout expired."""
+        # Same wait as Queue.join(), which has no timeout of its own.
+        pending = self._history_queue
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with pending.all_tasks_done:
+            while pending.unfinished_tasks:
+                if deadline is None:
+                    pending.all_tasks_done.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                pending.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Flush pending history lines and stop the background workers."""
+        self._fetch_pool.shutdown(wait=False)
+        if not self._history_writer.is_alive():
+            return
+        self._history_queue.put(None)
+        self._history_writer.join(timeout)
 
     def _append_memory_history(self, index_code: str, snapshot: Dict[str, Any]) -> None:
-        history = self._history_cache.setdefault(index_code, [])
+        history = self._history_cache.get(index_code)
+        if history is None:
+            history = self._history_cache[index_code] = deque(maxlen=MEMORY_HISTORY_SIZE)
         history.append(snapshot)
-        if len(history) > 500:
-            del history[:-500]
+        rule_window = self._rule_windows.get(index_code)
+        if rule_window is None:
+            rule_window = self._rule_windows[index_code] = _RuleStatsWindow(RULE_STATS_WINDOW)
+        rule_window.add(self._normalize_strategy(snapshot.get("strategy"))[2])
 
-    def _extract_quote_bucket(self, quotes: Dict[str, Any], symbol: str) -> Dict[str, Any]:
+    @staticmethod
+    def _extract_quote_buckets(quotes: Dict[str, Any], symbols: Tuple[str, ...]) -> Dict[str, Dict[str, Any]]:
+        # Schwab keys quotes by the requested symbol, occasionally without the "$" prefix.
         if not isinstance(quotes, dict):
-            return {}
-        bucket = quotes.get(symbol) or quotes.get(symbol.replace("$", ""))
-        if isinstance(bucket, dict):
-            return bucket
-        return {}
+            return {symbol: {} for symbol in symbols}
+        out: Dict[str, Dict[str, Any]] = {}
+        for symbol in symbols:
+            bucket = quotes.get(symbol) or quotes.get(_quote_alias(symbol))
+            out[symbol] = bucket if isinstance(bucket, dict) else {}
+        return out
 
     def _fetch_option_chain_with_fallback(self, symbol: str) -> Dict[str, Any]:
         candidates = [symbol]
@@ -144,7 +488,7 @@ class MarketSnapshotService:
                 "reason": reason,
             },
             "tradeable": {
-                "action": "NO_TRADE",
+                "action": _ACTION_NO_TRADE,
                 "primary_reason": reason,
                 "reasons": [reason],
                 "checks": {},
@@ -169,34 +513,32 @@ class MarketSnapshotService:
         }
 
     @staticmethod
-    def _extract_checks(strategy: Dict[str, Any] | None) -> Dict[str, Dict[str, Any]]:
+    def _normalize_strategy(
+        strategy: Any,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """Return (strategy, tradeable, checks), each a dict; checks fall back to tradeable["checks"]."""
         if not isinstance(strategy, dict):
-            return {}
-        checks = strategy.get("checks")
-        if isinstance(checks, dict):
-            return checks
+            return {}, {}, {}
         tradeable = strategy.get("tradeable")
-        if isinstance(tradeable, dict) and isinstance(tradeable.get("checks"), dict):
-            return tradeable.get("checks")  # type: ignore[return-value]
-        return {}
-
-    @staticmethod
-    def _check_label(name: str) -> tuple[str, str]:
-        return CHECK_LABELS.get(name, (name.replace("_", " "), name.replace("_", " ")))
+        if not isinstance(tradeable, dict):
+            tradeable = {}
+        checks = strategy.get("checks")
+        if not isinstance(checks, dict):
+            checks = tradeable.get("checks")
+            if not isinstance(checks, dict):
+                checks = {}
+        return strategy, tradeable, checks
 
     def _build_strategy_ui(
         self,
-        strategy: Dict[str, Any] | None,
+        tradeable: Dict[str, Any],
+        checks: Dict[str, Dict[str, Any]],
         *,
         snapshot_timestamp_local: str | None,
     ) -> Dict[str, Any]:
-        strategy = strategy if isinstance(strategy, dict) else {}
-        tradeable = strategy.get("tradeable") if isinstance(strategy.get("tradeable"), dict) else {}
-        checks = self._extract_checks(strategy)
-
-        action_raw = str((tradeable or {}).get("action") or "NO_TRADE").upper()
-        primary_reason = str((tradeable or {}).get("primary_reason") or "No primary reason.")
-        evaluated_at = (tradeable or {}).get("evaluated_at_et") or snapshot_timestamp_local
+        action_raw = str(tradeable.get("action") or _ACTION_NO_TRADE).upper()
+        primary_reason = str(tradeable.get("primary_reason") or _DEFAULT_PRIMARY_REASON)
+        evaluated_at = tradeable.get("evaluated_at_et") or snapshot_timestamp_local
 
         timeline: List[Dict[str, Any]] = []
         passed_count = 0
@@ -209,7 +551,7 @@ class MarketSnapshotService:
             blocking = bool(check.get("blocking", True))
             detail = str(check.get("detail") or ("Check passed" if ok else "Check failed"))
             severity = "pass" if ok else ("blocker" if blocking else "warning")
-            label_cn, label_en = self._check_label(name)
+            label_cn, label_en = _check_label(name)
             timeline.append(
                 {
                     "order": order,
@@ -232,9 +574,9 @@ class MarketSnapshotService:
 
         total = len(timeline)
         score_base = (passed_count / total * 100.0) if total else 45.0
-        if action_raw == "TRADE":
+        if action_raw == _ACTION_TRADE:
             score_base += 8.0
-        elif action_raw == "NO_TRADE":
+        elif action_raw == _ACTION_NO_TRADE:
             score_base -= 4.0
         score_base -= blocking_fail_count * 12.0
         score_base -= soft_warn_count * 4.0
@@ -252,94 +594,80 @@ class MarketSnapshotService:
             "timeline": timeline,
         }
 
-    def _decorate_snapshot(self, snapshot: Dict[str, Any]) -> None:
+    def _decorate_snapshot(
+        self,
+        snapshot: Dict[str, Any],
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """Attach strategy UI/event blocks; returns the normalized (strategy, tradeable, checks)."""
         if not isinstance(snapshot, dict):
-            return
-        strategy = snapshot.get("strategy")
-        strategy_dict = strategy if isinstance(strategy, dict) else {}
+            return {}, {}, {}
+        strategy, tradeable, checks = self._normalize_strategy(snapshot.get("strategy"))
         strategy_ui = self._build_strategy_ui(
-            strategy_dict,
+            tradeable,
+            checks,
             snapshot_timestamp_local=snapshot.get("timestamp_local"),
         )
         snapshot["strategy_ui"] = strategy_ui
-        if isinstance(strategy_dict, dict):
-            strategy_dict["ui"] = strategy_ui
-            snapshot["strategy"] = strategy_dict
+        strategy["ui"] = strategy_ui
+        snapshot["strategy"] = strategy
 
-        tradeable = strategy_dict.get("tradeable") if isinstance(strategy_dict.get("tradeable"), dict) else {}
         snapshot["strategy_event"] = {
-            "action": str((tradeable or {}).get("action") or "NO_TRADE"),
-            "primary_reason": str((tradeable or {}).get("primary_reason") or "No primary reason."),
-            "decision_score": strategy_ui.get("decision_score"),
-            "blocking_fail_count": strategy_ui.get("blocking_fail_count"),
-            "soft_warn_count": strategy_ui.get("soft_warn_count"),
+            # Unlike strategy_ui["action"], the event keeps the action's original casing.
+            "action": str(tradeable.get("action") or _ACTION_NO_TRADE),
+            "primary_reason": strategy_ui["primary_reason"],
+            "decision_score": strategy_ui["decision_score"],
+            "blocking_fail_count": strategy_ui["blocking_fail_count"],
+            "soft_warn_count": strategy_ui["soft_warn_count"],
         }
+        return strategy, tradeable, checks
 
-    def _compute_rule_stats(self, history_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        # Compute recent rule pass/fail profile to make debug view actionable.
-        window = history_items[-160:] if len(history_items) > 160 else history_items
-        raw_stats: Dict[str, Dict[str, int]] = {}
-
-        for item in window:
-            strategy = item.get("strategy") if isinstance(item, dict) else {}
-            checks = self._extract_checks(strategy if isinstance(strategy, dict) else {})
-            for name, payload in checks.items():
-                check = payload if isinstance(payload, dict) else {}
-                bucket = raw_stats.setdefault(
-                    name,
-                    {
-                        "seen": 0,
-                        "pass_count": 0,
-                        "fail_count": 0,
-                        "blocking_fail_count": 0,
-                        "soft_warn_count": 0,
-                    },
-                )
-                bucket["seen"] += 1
-                ok = bool(check.get("ok"))
-                blocking = bool(check.get("blocking", True))
-                if ok:
-                    bucket["pass_count"] += 1
-                else:
-                    bucket["fail_count"] += 1
-                    if blocking:
-                        bucket["blocking_fail_count"] += 1
-                    else:
-                        bucket["soft_warn_count"] += 1
-
+    @staticmethod
+    def _compute_rule_stats(
+        rule_counts: List[Tuple[str, _RuleCounts]],
+        top: int | None = None,
+    ) -> List[Dict[str, Any]]:
+        # Recent rule pass/fail profile to make debug view actionable; counts come from _RuleStatsWindow.
+        # With `top`, only the N worst rules are selected (partial heap select) and formatted.
+        if top is None:
+            rule_counts = sorted(rule_counts, key=_rule_stats_order)
+        else:
+            rule_counts = heapq.nsmallest(max(0, top), rule_counts, key=_rule_stats_order)
         out: List[Dict[str, Any]] = []
-        for name, bucket in raw_stats.items():
-            seen = max(bucket["seen"], 1)
-            label_cn, label_en = self._check_label(name)
+        for name, counts in rule_counts:
+            seen = max(counts.seen, 1)
+            label_cn, label_en = _check_label(name)
             out.append(
                 {
                     "name": name,
                     "label_cn": label_cn,
                     "label_en": label_en,
-                    "seen": bucket["seen"],
-                    "pass_count": bucket["pass_count"],
-                    "fail_count": bucket["fail_count"],
-                    "blocking_fail_count": bucket["blocking_fail_count"],
-                    "soft_warn_count": bucket["soft_warn_count"],
-                    "pass_rate": round(bucket["pass_count"] / seen * 100.0, 1),
-                    "blocking_fail_rate": round(bucket["blocking_fail_count"] / seen * 100.0, 1),
+                    "seen": counts.seen,
+                    "pass_count": counts.pass_count,
+                    "fail_count": counts.fail_count,
+                    "blocking_fail_count": counts.blocking_fail_count,
+                    "soft_warn_count": counts.soft_warn_count,
+                    "pass_rate": round(counts.pass_count / seen * 100.0, 1),
+                    "blocking_fail_rate": round(counts.blocking_fail_count / seen * 100.0, 1),
                 }
             )
-        out.sort(key=lambda x: (-int(x["blocking_fail_count"]), x["name"]))
         return out
 
     def refresh_snapshot(self, index_code: str) -> Dict[str, Any]:
         index_code = index_code.upper()
-        schwab_symbol = self._resolve_schwab_symbol(index_code)
+        schwab_symbol = _resolve_schwab_symbol(index_code)
         now = dt.datetime.now()
-        now_utc = dt.datetime.now(dt.timezone.utc)
+        now_utc = now.astimezone(dt.timezone.utc)
         started_at = time.perf_counter()
 
         try:
-            quotes = self.client.get_quotes([schwab_symbol, VIX_SYMBOL])
-            index_quote = self._extract_quote_bucket(quotes, schwab_symbol)
-            vix_quote = self._extract_quote_bucket(quotes, VIX_SYMBOL)
-            chain = self._fetch_option_chain_with_fallback(schwab_symbol)
+            chain_future = self._fetch_pool.submit(self._fetch_option_chain_with_fallback, schwab_symbol)
+            # RSI/down-days/gap come from yfinance and do not depend on the chain; fetch them meanwhile.
+            metrics_future = self._fetch_pool.submit(collect_extended_metrics, index_code)
+            quotes = self.client.get_quotes_batched([schwab_symbol, VIX_SYMBOL])
+            chain = chain_future.result()
+            buckets = self._extract_quote_buckets(quotes, (schwab_symbol, VIX_SYMBOL))
+            index_quote = buckets[schwab_symbol]
+            vix_quote = buckets[VIX_SYMBOL]
 
             snapshot = build_dashboard_snapshot(
                 index_code=index_code,
@@ -358,6 +686,7 @@ class MarketSnapshotService:
                     now_utc=now_utc,
                     include_extended_metrics=True,
                     fast_mode=self.strategy_fast_mode,
+                    extended_metrics=metrics_future.result(),
                 )
             except Exception as strategy_exc:
                 snapshot["strategy"] = self._build_unavailable_strategy(
@@ -365,55 +694,62 @@ class MarketSnapshotService:
                     now_utc=now_utc,
                     reason=f"Strategy compute failed: {strategy_exc}",
                 )
+            refreshed_epoch = time.time()
+            refreshed_monotonic = time.monotonic()
             snapshot["system"] = {
                 "refresh_seconds": self.refresh_seconds,
-                "last_refresh_epoch": time.time(),
+                "last_refresh_epoch": refreshed_epoch,
                 "source": "schwab",
                 "error": None,
             }
-            self._decorate_snapshot(snapshot)
+            strategy, tradeable, checks = self._decorate_snapshot(snapshot)
             elapsed_ms = round((time.perf_counter() - started_at) * 1000.0, 2)
-            strategy = snapshot.get("strategy", {})
-            checks = strategy.get("checks", {}) if isinstance(strategy, dict) else {}
-            action = (strategy.get("tradeable") or {}).get("action") if isinstance(strategy, dict) else None
+            market = snapshot.get("market") or {}
             event = {
                 "timestamp_utc": now_utc.isoformat(),
                 "level": "info",
                 "event": "snapshot_refresh_ok",
                 "index": index_code,
                 "duration_ms": elapsed_ms,
-                "spot": snapshot.get("market", {}).get("spot"),
-                "vix": snapshot.get("market", {}).get("vix"),
+                "spot": market.get("spot"),
+                "vix": market.get("vix"),
                 "has_strategy": bool(strategy),
                 "checks_count": len(checks),
-                "action": action,
+                "action": tradeable.get("action"),
             }
-            self._logger.info(json.dumps(event, ensure_ascii=False))
+            self._logger.info("%s", _LazyJSON(event))
             self._append_event(event)
-            slow_threshold_ms = self.refresh_seconds * 1000.0
-            if elapsed_ms > slow_threshold_ms:
+            if elapsed_ms > self._slow_threshold_ms:
                 warn_event = {
                     "timestamp_utc": now_utc.isoformat(),
                     "level": "warning",
                     "event": "snapshot_refresh_slow",
                     "index": index_code,
                     "duration_ms": elapsed_ms,
-                    "threshold_ms": slow_threshold_ms,
+                    "threshold_ms": self._slow_threshold_ms,
                     "message": "Snapshot refresh exceeded configured refresh interval.",
                 }
-                self._logger.warning(json.dumps(warn_event, ensure_ascii=False))
+                self._logger.warning("%s", _LazyJSON(warn_event))
                 self._append_event(warn_event)
-            with self._lock:
-                state = self._states.setdefault(index_code, SnapshotState())
-                state.snapshot = snapshot
-                state.updated_at_epoch = time.time()
-                state.last_error = None
+            encoded = dumps_bytes(snapshot)
+            self._publish_state(
+                index_code,
+                SnapshotState(
+                    snapshot=snapshot,
+                    updated_at_epoch=refreshed_epoch,
+                    updated_at_monotonic=refreshed_monotonic,
+                    serialized=encoded,
+                ),
+            )
+            with self._index_lock(index_code):
                 self._append_memory_history(index_code, snapshot)
-            self._write_history(index_code, snapshot)
+            self._write_history(index_code, snapshot, now=now, encoded=encoded)
             return snapshot
         except SchwabClientError as exc:
+            refreshed_epoch = time.time()
+            refreshed_monotonic = time.monotonic()
             error_snapshot = {
-                "timestamp_utc": now.astimezone(dt.timezone.utc).isoformat(),
+                "timestamp_utc": now_utc.isoformat(),
                 "timestamp_local": now.strftime("%Y-%m-%d %H:%M:%S"),
                 "index": {"code": index_code, "symbol": schwab_symbol},
                 "market": {"spot": None, "vix": None, "quote": {}, "vix_quote": {}},
@@ -427,7 +763,7 @@ class MarketSnapshotService:
                 ),
                 "system": {
                     "refresh_seconds": self.refresh_seconds,
-                    "last_refresh_epoch": time.time(),
+                    "last_refresh_epoch": refreshed_epoch,
                     "source": "schwab",
                     "error": str(exc),
                 },
@@ -442,70 +778,102 @@ class MarketSnapshotService:
                 "duration_ms": elapsed_ms,
                 "error": str(exc),
             }
-            self._logger.error(json.dumps(event, ensure_ascii=False))
+            self._logger.error("%s", _LazyJSON(event))
             self._append_event(event)
-            with self._lock:
-                state = self._states.setdefault(index_code, SnapshotState())
-                state.snapshot = error_snapshot
-                state.updated_at_epoch = time.time()
-                state.last_error = str(exc)
+            self._publish_state(
+                index_code,
+                SnapshotState(
+                    snapshot=error_snapshot,
+                    updated_at_epoch=refreshed_epoch,
+                    updated_at_monotonic=refreshed_monotonic,
+                    last_error=str(exc),
+                    serialized=dumps_bytes(error_snapshot),
+                ),
+            )
+            with self._index_lock(index_code):
                 self._append_memory_history(index_code, error_snapshot)
             return error_snapshot
 
+    def _fresh_snapshot(self, index_code: str) -> Dict[str, Any] | None:
+        state = self._states.get(index_code)
+        if state and state.snapshot and (time.monotonic() - state.updated_at_monotonic) < self.refresh_seconds:
+            return state.snapshot
+        return None
+
+    def _run_refresh(self, index_code: str, future: "Future[Dict[str, Any]]") -> Dict[str, Any]:
+        try:
+            # A refresh may have completed between the caller's freshness check and claiming the slot.
+            result = self._fresh_snapshot(index_code) or self.refresh_snapshot(index_code)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._index_lock(index_code):
+                self._inflight.pop(index_code, None)
+
     def get_snapshot(self, index_code: str) -> Dict[str, Any]:
         index_code = index_code.upper()
-        with self._lock:
-            state = self._states.get(index_code)
-            snapshot = state.snapshot if state else None
-            if snapshot and (time.time() - state.updated_at_epoch) < self.refresh_seconds:
-                return snapshot
-            refresh_lock = self._refresh_locks.setdefault(index_code, threading.Lock())
-
-        if refresh_lock.acquire(blocking=False):
-            try:
-                return self.refresh_snapshot(index_code)
-            finally:
-                refresh_lock.release()
+        state = self._states.get(index_code)
+        snapshot = state.snapshot if state else None
+        if snapshot and (time.monotonic() - state.updated_at_monotonic) < self.refresh_seconds:
+            return snapshot
+
+        with self._index_lock(index_code):
+            inflight = self._inflight.get(index_code)
+            if inflight is None:
+                owned: "Future[Dict[str, Any]]" = Future()
+                self._inflight[index_code] = owned
+        if inflight is None:
+            return self._run_refresh(index_code, owned)
 
         # Another request is already refreshing this index.
         # Return stale snapshot immediately if available to avoid API read timeouts.
         if snapshot:
-            stale_snapshot = deepcopy(snapshot)
+            # Only "system" differs from the cached snapshot, so copy the top level and that dict.
+            stale_snapshot = dict(snapshot)
             stale_system = dict(stale_snapshot.get("system") or {})
             stale_system["stale"] = True
             stale_system["stale_reason"] = "refresh_in_progress"
             stale_snapshot["system"] = stale_system
             return stale_snapshot
 
-        # No cached snapshot yet; wait briefly for in-flight refresh to complete.
-        if refresh_lock.acquire(timeout=max(1.0, self.refresh_seconds)):
-            refresh_lock.release()
-            with self._lock:
-                state = self._states.get(index_code)
-                if state and state.snapshot:
-                    return state.snapshot
+        # No cached snapshot yet; share the in-flight refresh result.
+        try:
+            return inflight.result(timeout=max(1.0, self.refresh_seconds))
+        except FutureTimeoutError:
+            return self.refresh_snapshot(index_code)
 
-        return self.refresh_snapshot(index_code)
+    def get_snapshot_json(self, index_code: str) -> bytes:
+        """Same as get_snapshot(), encoded as JSON; reuses the bytes cached at refresh time."""
+        index_code = index_code.upper()
+        snapshot = self.get_snapshot(index_code)
+        state = self._states.get(index_code)
+        if state is not None and state.snapshot is snapshot and state.serialized is not None:
+            return state.serialized
+        return dumps_bytes(snapshot)
 
     def get_history(self, index_code: str, limit: int = 100) -> List[Dict[str, Any]]:
         index_code = index_code.upper()
         limit = max(1, min(1000, int(limit)))
-        with self._lock:
-            history = list(self._history_cache.get(index_code, []))
-        if history:
-            return list(reversed(history[-limit:]))
-        return []
+        with self._index_lock(index_code):
+            history = self._history_cache.get(index_code)
+            if not history:
+                return []
+            return list(itertools.islice(reversed(history), limit))
 
     def health(self) -> Dict[str, Any]:
-        with self._lock:
-            state_summary = {
-                key: {
-                    "updated_at_epoch": value.updated_at_epoch,
-                    "has_snapshot": value.snapshot is not None,
-                    "last_error": value.last_error,
-                }
-                for key, value in self._states.items()
+        states = dict(self._states)
+        state_summary = {
+            key: {
+                "updated_at_epoch": value.updated_at_epoch,
+                "has_snapshot": value.snapshot is not None,
+                "last_error": value.last_error,
             }
+            for key, value in states.items()
+        }
         return {
             "status": "ok",
             "source": "schwab",
@@ -516,18 +884,24 @@ class MarketSnapshotService:
 
     def debug(self, index_code: str) -> Dict[str, Any]:
         index_code = index_code.upper()
-        with self._lock:
-            state = self._states.get(index_code)
-            snapshot = state.snapshot if state else None
-            recent_events = list(self._recent_events)[-80:]
-            recent_errors = list(self._recent_errors)[-50:]
-            history_items = list(self._history_cache.get(index_code, []))
-            cache_size = len(history_items)
-
-        strategy = snapshot.get("strategy") if isinstance(snapshot, dict) else {}
-        checks = strategy.get("checks", {}) if isinstance(strategy, dict) else {}
-        tradeable = strategy.get("tradeable", {}) if isinstance(strategy, dict) else {}
-        rule_stats = self._compute_rule_stats(history_items)
+        state = self._states.get(index_code)
+        snapshot = state.snapshot if state else None
+        # Materialize only the tail instead of copying the whole buffer first.
+        recent_events = list(itertools.islice(reversed(self._recent_events), 80))[::-1]
+        recent_errors = list(itertools.islice(reversed(self._recent_errors), 50))[::-1]
+        with self._index_lock(index_code):
+            cache_size = len(self._history_cache.get(index_code, ()))
+            rule_window = self._rule_windows.get(index_code)
+            rule_counts = rule_window.counts() if rule_window is not None else []
+
+        snap = snapshot if isinstance(snapshot, dict) else {}
+        market = snap.get("market") or {}
+        gex = snap.get("gex") or {}
+        strategy = snap.get("strategy")
+        strategy = strategy if isinstance(strategy, dict) else {}
+        checks = strategy.get("checks") or {}
+        tradeable = strategy.get("tradeable") or {}
+        rule_stats = self._compute_rule_stats(rule_counts)
         return {
             "index": index_code,
             "service": {
@@ -539,16 +913,16 @@ class MarketSnapshotService:
                 "updated_at_epoch": state.updated_at_epoch if state else None,
             },
             "snapshot_summary": {
-                "timestamp_local": snapshot.get("timestamp_local") if isinstance(snapshot, dict) else None,
-                "spot": snapshot.get("market", {}).get("spot") if isinstance(snapshot, dict) else None,
-                "vix": snapshot.get("market", {}).get("vix") if isinstance(snapshot, dict) else None,
-                "pin": snapshot.get("gex", {}).get("pin") if isinstance(snapshot, dict) else None,
-                "direction_bias": snapshot.get("gex", {}).get("direction_bias") if isinstance(snapshot, dict) else None,
+                "timestamp_local": snap.get("timestamp_local"),
+                "spot": market.get("spot"),
+                "vix": market.get("vix"),
+                "pin": gex.get("pin"),
+                "direction_bias": gex.get("direction_bias"),
                 "strategy_action": tradeable.get("action"),
                 "strategy_primary_reason": tradeable.get("primary_reason"),
                 "strategy_checks_count": len(checks),
-                "decision_score": (snapshot.get("strategy_ui") or {}).get("decision_score") if isinstance(snapshot, dict) else None,
-                "strategy_keys": sorted(strategy.keys()) if isinstance(strategy, dict) else [],
+                "decision_score": (snap.get("strategy_ui") or {}).get("decision_score"),
+                "strategy_keys": sorted(strategy.keys()),
             },
             "rule_stats": rule_stats,
             "recent_errors": recent_errors,
@@ -1,3 +1,17 @@
-from .engine import SignalOverrides, build_dashboard_strategy, evaluate_signal, format_human_signal
+from .engine import (
+    ExtendedMetrics,
+    SignalOverrides,
+    build_dashboard_strategy,
+    collect_extended_metrics,
+    evaluate_signal,
+    format_human_signal,
+)
 
-__all__ = ["SignalOverrides", "build_dashboard_strategy", "evaluate_signal", "format_human_signal"]
+__all__ = [
+    "ExtendedMetrics",
+    "SignalOverrides",
+    "build_dashboard_strategy",
+    "collect_extended_metrics",
+    "evaluate_signal",
+    "format_human_signal",
+]
@@ -1,21 +1,31 @@
 from __future__ import annotations
 
-import contextlib
+import atexit
 import datetime
-import io
-import json
+import functools
+import inspect
+import logging
 import math
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import pytz
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import yfinance as yf
+import yfinance.multi as _yf_multi
 
-from app.common.filelock import locked_open
+from app.analytics._njit import NUMBA_AVAILABLE, njit
+from app.common.filelock import lock_stream, unlock_stream
+from app.common.jsonutil import dumps_bytes, loads as json_loads
 from app.common.paths import data_path
 from core.gex_strategy import get_gex_trade_setup
 from index_config import IndexConfig, get_index_config
@@ -23,6 +33,27 @@ from index_config import IndexConfig, get_index_config
 
 ET = pytz.timezone("US/Eastern")
 LIVE_URL = "https://api.tradier.com/v1"
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 16
+
+# Independent Tradier/yfinance lookups run here concurrently; each is an HTTPS round trip.
+_FETCH_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="signal-fetch")
+EXTENDED_METRICS_TIMEOUT_SECONDS = 15.0
+# Repeat quote/download lookups within this window (e.g. SPX and NDX refreshing together) share one request.
+QUOTE_MEMO_TTL_SECONDS = 10.0
+# RSI, down days and gap all read the same daily bars; one 30-day download covers every window.
+# 0DTE chains are large; open interest and gamma barely move between dashboard polls.
+OPTION_CHAIN_TTL_SECONDS = 30.0
+DAILY_BARS_PERIOD = "30d"
+DAILY_BARS_TTL_SECONDS = 60.0
+GAP_SYMBOL = "SPY"
+
+# yfinance tickers for each index code; unknown codes fall back to the S&P 500.
+YF_INDEX_TICKERS = {"SPX": "^GSPC", "NDX": "^NDX", "DJX": "^DJI"}
+YF_DEFAULT_INDEX_TICKER = "^GSPC"
+# Minimum plausible spot per index symbol, used to reject bad quotes; DJX trades at 1/100 of the Dow.
+INDEX_PRICE_THRESHOLDS = {"DJX": 100.0}
+DEFAULT_INDEX_PRICE_THRESHOLD = 1000.0
 
 # Signal filter settings aligned with live scalper defaults.
 CUTOFF_HOUR = 13
@@ -34,6 +65,8 @@ SKIP_FRIDAY = False
 MAX_CONSEC_DOWN_DAYS = 5
 MAX_GAP_PCT = 0.5
 MIN_EXPECTED_MOVE_BASE = 10.0
+# sqrt(2h / (252 days * 6.5h)): annualized VIX scaled to a two-hour horizon.
+EXPECTED_MOVE_2HR_FACTOR = math.sqrt(2.0 / (252 * 6.5))
 
 
 @dataclass(frozen=True)
@@ -43,73 +76,193 @@ class SignalOverrides:
     vix_override: float | None = None
 
 
+@dataclass(frozen=True)
+class ExtendedMetrics:
+    rsi: float = 50.0
+    consecutive_down_days: int = 0
+    gap_pct: float = 0.0
+    source: str = "defaults"
+    warning: str | None = None
+
+
+def _build_tradier_session() -> requests.Session:
+    # Keep-alive pool so quote and chain polls reuse TLS connections; all Tradier calls here are GETs.
+    retry = Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    return session
+
+
+_TRADIER_SESSION = _build_tradier_session()
+
+
 def _safe_float(value: Any) -> float | None:
+    # API payloads are mostly plain floats/ints already; skip the float() call and try frame for them.
+    if type(value) is float:
+        return value if math.isfinite(value) else None
+    if type(value) is int:
+        return float(value)
+    if value is None:
+        return None
     try:
-        if value is None:
-            return None
         out = float(value)
-        if math.isnan(out) or math.isinf(out):
-            return None
-        return out
     except (TypeError, ValueError):
         return None
+    return out if math.isfinite(out) else None
 
 
-def _fetch_tradier_quote(symbol: str, live_key: str) -> float | None:
-    if not live_key:
-        return None
+def _has_rows(frame: pd.DataFrame) -> bool:
+    return not frame.empty
+
+
+def _ttl_memo(
+    ttl_seconds: float,
+    *,
+    keep: Callable[[Any], bool] = lambda value: value is not None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Memoize a fetcher per argument tuple for `ttl_seconds`.
+
+    Results rejected by `keep` (failed lookups by default) and exceptions are not cached,
+    so the next call retries. Cached values are shared; callers must not mutate them.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        cache: Dict[Any, Tuple[float, Any]] = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            with lock:
+                hit = cache.get(key)
+            if hit is not None and now - hit[0] < ttl_seconds:
+                return hit[1]
+            value = func(*args, **kwargs)
+            if keep(value):
+                with lock:
+                    for stale in [k for k, (stored, _) in cache.items() if now - stored >= ttl_seconds]:
+                        del cache[stale]
+                    cache[key] = (now, value)
+            return value
+
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def _quote_price(quote: Dict[str, Any]) -> float | None:
+    for key in ("last", "bid", "ask"):
+        price = _safe_float(quote.get(key))
+        if price is not None and price > 0:
+            return price
+    return None
+
+
+@_ttl_memo(QUOTE_MEMO_TTL_SECONDS, keep=bool)
+def _fetch_tradier_quotes_multi(symbols: Tuple[str, ...], live_key: str) -> Dict[str, float]:
+    """Prices for `symbols` from one Tradier quotes request; symbols without a usable price are omitted."""
+    if not live_key or not symbols:
+        return {}
 
     headers = {"Accept": "application/json", "Authorization": f"Bearer {live_key}"}
     try:
-        r = requests.get(f"{LIVE_URL}/markets/quotes", headers=headers, params={"symbols": symbol}, timeout=10)
+        r = _TRADIER_SESSION.get(
+            f"{LIVE_URL}/markets/quotes",
+            headers=headers,
+            params={"symbols": ",".join(symbols)},
+            timeout=10,
+        )
         if r.status_code != 200:
-            return None
-        quote = r.json().get("quotes", {}).get("quote")
-        if not quote:
-            return None
-        if isinstance(quote, list):
-            quote = quote[0]
-        for key in ("last", "bid", "ask"):
-            price = _safe_float(quote.get(key))
-            if price is not None and price > 0:
-                return price
-        return None
+            return {}
+        quotes = json_loads(r.content).get("quotes", {}).get("quote")
+        if not quotes:
+            return {}
+        if isinstance(quotes, dict):
+            quotes = [quotes]
+        prices: Dict[str, float] = {}
+        for quote in quotes:
+            symbol = quote.get("symbol")
+            price = _quote_price(quote)
+            if symbol and price is not None:
+                prices[symbol] = price
+        return prices
     except Exception:
-        return None
+        return {}
+
+
+def _fetch_tradier_quote(symbol: str, live_key: str) -> float | None:
+    return _fetch_tradier_quotes_multi((symbol,), live_key).get(symbol)
 
 
 def _fetch_yf_last_price(symbol: str, period: str = "1d", interval: str = "1m") -> float | None:
     try:
-        df = _yf_download(symbol, period=period, interval=interval, auto_adjust=True)
+        df = _yf_download(symbol, period=period, interval=interval)
         if df.empty:
             return None
-        close = df["Close"].iloc[-1]
-        if isinstance(close, pd.Series):
-            close = close.iloc[0]
-        return _safe_float(close)
+        return _safe_float(df["Close"].iloc[-1])
     except Exception:
         return None
 
 
+# yfinance reports failed downloads through its logger. Quiet that logger rather than redirecting
+# sys.stdout/stderr: the redirect is process-wide, so while metrics were fetched on a worker thread
+# it swallowed (and could permanently replace) other threads' output.
+logging.getLogger("yfinance").setLevel(logging.CRITICAL)
+
+# Older yfinance releases keep download() scratch state in module globals, so concurrent downloads
+# can clobber each other's frames; serialize them there. Newer releases use per-call state.
+_YF_DOWNLOAD_LOCK = None if hasattr(_yf_multi, "_DownloadCtx") else threading.Lock()
+# yfinance 0.2.48+ returns (Price, Ticker) MultiIndex columns even for one ticker unless told not to;
+# earlier releases always return flat columns for a single ticker.
+_YF_HAS_MULTI_LEVEL_INDEX = "multi_level_index" in inspect.signature(yf.download).parameters
+
+
+@_ttl_memo(QUOTE_MEMO_TTL_SECONDS, keep=_has_rows)
 def _yf_download(*args: Any, **kwargs: Any) -> pd.DataFrame:
     kwargs.setdefault("progress", False)
-    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+    kwargs.setdefault("auto_adjust", True)
+    if _YF_HAS_MULTI_LEVEL_INDEX:
+        kwargs.setdefault("multi_level_index", False)
+    if _YF_DOWNLOAD_LOCK is None:
+        return yf.download(*args, **kwargs)
+    with _YF_DOWNLOAD_LOCK:
         return yf.download(*args, **kwargs)
 
 
-def get_index_price(index_config: IndexConfig, live_key: str) -> Tuple[float | None, str]:
-    threshold = 100.0 if index_config.index_symbol == "DJX" else 1000.0
+def get_index_price(
+    index_config: IndexConfig,
+    live_key: str,
+    *,
+    quotes: Dict[str, float] | None = None,
+) -> Tuple[float | None, str]:
+    threshold = INDEX_PRICE_THRESHOLDS.get(index_config.index_symbol, DEFAULT_INDEX_PRICE_THRESHOLD)
+    if quotes is None:
+        quotes = _fetch_tradier_quotes_multi((index_config.index_symbol, index_config.etf_symbol), live_key)
 
-    index_price = _fetch_tradier_quote(index_config.index_symbol, live_key)
+    index_price = quotes.get(index_config.index_symbol)
     if index_price is not None and index_price > threshold:
         return round(index_price), "tradier_index"
 
-    etf_price = _fetch_tradier_quote(index_config.etf_symbol, live_key)
+    etf_price = quotes.get(index_config.etf_symbol)
     if etf_price is not None and etf_price > 10:
         return round(etf_price * index_config.etf_multiplier), "tradier_etf_proxy"
 
-    ticker_map = {"SPX": "^GSPC", "NDX": "^NDX", "DJX": "^DJI"}
-    yf_index = _fetch_yf_last_price(ticker_map.get(index_config.code, "^GSPC"))
+    yf_index = _fetch_yf_last_price(YF_INDEX_TICKERS.get(index_config.code, YF_DEFAULT_INDEX_TICKER))
     if yf_index is not None and yf_index > threshold:
         return round(yf_index), "yfinance_index"
 
@@ -120,18 +273,15 @@ def get_index_price(index_config: IndexConfig, live_key: str) -> Tuple[float | N
     return None, "unavailable"
 
 
-def get_vix(live_key: str) -> Tuple[float | None, str]:
-    tradier_vix = _fetch_tradier_quote("VIX", live_key)
+def get_vix(live_key: str, *, quotes: Dict[str, float] | None = None) -> Tuple[float | None, str]:
+    tradier_vix = quotes.get("VIX") if quotes is not None else _fetch_tradier_quote("VIX", live_key)
     if tradier_vix is not None and tradier_vix > 5:
         return tradier_vix, "tradier"
 
     try:
         vix_data = _yf_download("^VIX", period="1d")
         if not vix_data.empty:
-            close = vix_data["Close"].iloc[-1]
-            if isinstance(close, pd.Series):
-                close = close.iloc[0]
-            vix_value = _safe_float(close)
+            vix_value = _safe_float(vix_data["Close"].iloc[-1])
             if vix_value is not None and vix_value > 5:
                 return vix_value, "yfinance"
     except Exception:
@@ -140,28 +290,63 @@ def get_vix(live_key: str) -> Tuple[float | None, str]:
     return None, "unavailable"
 
 
-def get_rsi(symbol: str = "SPY", period: int = 14) -> float:
+@_ttl_memo(DAILY_BARS_TTL_SECONDS, keep=_has_rows)
+def _fetch_daily_bars(symbol: str) -> pd.DataFrame:
+    """Recent adjusted daily bars for `symbol`, shared across metrics for DAILY_BARS_TTL_SECONDS."""
+    return _yf_download(symbol, period=DAILY_BARS_PERIOD)
+
+
+def _daily_bars_or_empty(symbol: str) -> pd.DataFrame:
+    # Metric helpers fall back to their defaults on an empty frame, matching a failed download.
+    try:
+        return _fetch_daily_bars(symbol)
+    except Exception:
+        return pd.DataFrame()
+
+
+@njit(cache=True)
+def _rsi_window_kernel(close, period):  # type: ignore[no-untyped-def]
+    # Same averages as the NumPy path: mean gain/loss over the last `period` one-bar moves,
+    # with a move touching a missing close counted as flat.
+    n = close.size
+    gain = 0.0
+    loss = 0.0
+    for i in range(max(n - period, 1), n):
+        change = close[i] - close[i - 1]
+        if change > 0:
+            gain += change
+        elif change < 0:
+            loss -= change
+    return gain / period, loss / period
+
+
+def _rsi_window_averages(close: np.ndarray, period: int) -> Tuple[float, float]:
+    if NUMBA_AVAILABLE:
+        return _rsi_window_kernel(close, period)
+    window = np.diff(close[-(period + 1):], prepend=np.nan)[-period:]
+    avg_gain = float(np.where(window > 0, window, 0.0).mean())
+    avg_loss = float(np.where(window < 0, -window, 0.0).mean())
+    return avg_gain, avg_loss
+
+
+def get_rsi(symbol: str = "SPY", period: int = 14, *, bars: pd.DataFrame | None = None) -> float:
     try:
-        data = _yf_download(symbol, period="30d", auto_adjust=True)
+        data = _fetch_daily_bars(symbol) if bars is None else bars
         if data.empty:
             return 50.0
 
         close = data["Close"]
-        if isinstance(close, pd.DataFrame):
-            close = close.iloc[:, 0]
 
-        delta = close.diff()
-        gain = delta.where(delta > 0, 0)
-        loss = (-delta).where(delta < 0, 0)
-        avg_gain = gain.rolling(window=period, min_periods=period).mean()
-        avg_loss = loss.rolling(window=period, min_periods=period).mean()
-
-        avg_gain_val = avg_gain.iloc[-1]
-        avg_loss_val = avg_loss.iloc[-1]
+        # Simple-average RSI: only the final window matters, so average the last `period` moves
+        # directly instead of building two rolling series.
+        close_values = close.to_numpy(dtype=np.float64)
+        if close_values.size < period:
+            return 100.0
+        avg_gain_val, avg_loss_val = _rsi_window_averages(close_values, period)
 
-        if avg_loss_val == 0 or pd.isna(avg_loss_val):
+        if avg_loss_val == 0:
             return 100.0
-        if avg_gain_val == 0 or pd.isna(avg_gain_val):
+        if avg_gain_val == 0:
             return 0.0
 
         rs = avg_gain_val / avg_loss_val
@@ -171,43 +356,31 @@ def get_rsi(symbol: str = "SPY", period: int = 14) -> float:
         return 50.0
 
 
-def get_consecutive_down_days(symbol: str = "SPY") -> int:
+def get_consecutive_down_days(symbol: str = "SPY", *, bars: pd.DataFrame | None = None) -> int:
     try:
-        data = _yf_download(symbol, period="10d", auto_adjust=True)
+        data = (_fetch_daily_bars(symbol) if bars is None else bars).tail(10)
         if data.empty:
             return 0
 
         close = data["Close"]
-        if isinstance(close, pd.DataFrame):
-            close = close.iloc[:, 0]
-
-        returns = close.pct_change().dropna()
-        count = 0
-        for value in reversed(returns.tolist()):
-            if value < 0:
-                count += 1
-            else:
-                break
-        return count
+
+        # Length of the trailing run of down closes. Changes touching a missing close are skipped,
+        # as pct_change().dropna() did.
+        changes = np.diff(close.to_numpy(dtype=float))
+        not_down = ~(changes[~np.isnan(changes)][::-1] < 0)
+        return int(not_down.argmax()) if not_down.any() else int(not_down.size)
     except Exception:
         return 0
 
 
-def calculate_gap_size() -> float:
+def calculate_gap_size(*, bars: pd.DataFrame | None = None) -> float:
     try:
-        data = _yf_download("SPY", period="2d", auto_adjust=True)
+        data = (_fetch_daily_bars(GAP_SYMBOL) if bars is None else bars).tail(2)
         if len(data) < 2:
             return 0.0
 
-        prev_close = data["Close"].iloc[-2]
-        today_open = data["Open"].iloc[-1]
-        if isinstance(prev_close, pd.Series):
-            prev_close = prev_close.iloc[0]
-        if isinstance(today_open, pd.Series):
-            today_open = today_open.iloc[0]
-
-        prev_close_f = _safe_float(prev_close)
-        today_open_f = _safe_float(today_open)
+        prev_close_f = _safe_float(data["Close"].iloc[-2])
+        today_open_f = _safe_float(data["Open"].iloc[-1])
         if prev_close_f is None or today_open_f is None or prev_close_f == 0:
             return 0.0
 
@@ -217,65 +390,91 @@ def calculate_gap_size() -> float:
         return 0.0
 
 
-def calculate_gex_pin(index_config: IndexConfig, index_price: float, live_key: str) -> float | None:
-    if not live_key:
-        return None
-
+@_ttl_memo(OPTION_CHAIN_TTL_SECONDS, keep=bool)
+def _fetch_option_chain(symbol: str, expiration: str, live_key: str) -> List[Dict[str, Any]]:
+    """Parsed option list (with greeks) for one expiration; empty on any failure."""
     headers = {"Accept": "application/json", "Authorization": f"Bearer {live_key}"}
-    today = datetime.date.today().strftime("%Y-%m-%d")
     try:
-        r = requests.get(
+        r = _TRADIER_SESSION.get(
             f"{LIVE_URL}/markets/options/chains",
             headers=headers,
-            params={"symbol": index_config.index_symbol, "expiration": today, "greeks": "true"},
+            params={"symbol": symbol, "expiration": expiration, "greeks": "true"},
             timeout=15,
         )
         if r.status_code != 200:
-            return None
-        options = r.json().get("options", {}).get("option", [])
-        if not options:
-            return None
+            return []
+        # Chains run to thousands of contracts; orjson parses the body several times faster.
+        options = (json_loads(r.content).get("options") or {}).get("option") or []
+        return [options] if isinstance(options, dict) else options
     except Exception:
+        return []
+
+
+def calculate_gex_pin(index_config: IndexConfig, index_price: float, live_key: str) -> float | None:
+    if not live_key:
+        return None
+
+    today = datetime.date.today().strftime("%Y-%m-%d")
+    options = _fetch_option_chain(index_config.index_symbol, today, live_key)
+    if not options:
         return None
 
-    gex_by_strike: Dict[float, float] = {}
+    # One pass over the chain into parallel columns (filled as lists, then converted once);
+    # unusable values become NaN.
+    strike_col: List[float] = []
+    oi_col: List[float] = []
+    gamma_col: List[float] = []
+    call_col: List[bool] = []
+    nan = math.nan
     for opt in options:
         strike = _safe_float(opt.get("strike"))
-        oi = _safe_float(opt.get("open_interest"))
-        gamma = _safe_float((opt.get("greeks") or {}).get("gamma"))
-        if strike is None or oi is None or gamma is None:
-            continue
-        if oi == 0 or gamma == 0:
-            continue
-
-        gex = gamma * oi * 100 * (index_price ** 2)
-        if opt.get("option_type") == "call":
-            gex_by_strike[strike] = gex_by_strike.get(strike, 0.0) + gex
-        else:
-            gex_by_strike[strike] = gex_by_strike.get(strike, 0.0) - gex
-
-    if not gex_by_strike:
+        oi_value = _safe_float(opt.get("open_interest"))
+        gamma_value = _safe_float((opt.get("greeks") or {}).get("gamma"))
+        strike_col.append(nan if strike is None else strike)
+        oi_col.append(nan if oi_value is None else oi_value)
+        gamma_col.append(nan if gamma_value is None else gamma_value)
+        call_col.append(opt.get("option_type") == "call")
+    strikes = np.array(strike_col, dtype=float)
+    oi = np.array(oi_col, dtype=float)
+    gamma = np.array(gamma_col, dtype=float)
+    is_call = np.array(call_col, dtype=bool)
+    sign = np.where(is_call, 1.0, -1.0)
+
+    weight = gamma * oi
+    # Rows missing a strike, open interest or gamma are NaN here; zero OI/gamma contributes nothing.
+    valid = ~np.isnan(strikes) & ~np.isnan(weight) & (weight != 0)
+    if not valid.any():
         return None
+    gex = weight[valid] * 100 * (index_price ** 2) * sign[valid]
+    uniq, first_seen, inverse = np.unique(strikes[valid], return_index=True, return_inverse=True)
+    totals = np.zeros_like(uniq)
+    np.add.at(totals, inverse, gex)
+    # Strikes in chain order (first appearance), the order the old per-strike dict iterated in.
+    order = np.argsort(first_seen, kind="stable")
+    uniq = uniq[order]
+    totals = totals[order]
 
     max_distance_pct = 0.015 if index_config.code == "SPX" else 0.020
     max_distance = index_price * max_distance_pct
-    nearby_positive = [(s, g) for s, g in gex_by_strike.items() if abs(s - index_price) < max_distance and g > 0]
-
-    if not nearby_positive:
-        nearby_positive = [(s, g) for s, g in gex_by_strike.items() if abs(s - index_price) < index_config.far_max and g > 0]
-
-    if nearby_positive:
-        def score_peak(strike: float, gex: float) -> float:
-            distance_pct = abs(strike - index_price) / max(index_price, 1.0)
-            return gex / (distance_pct ** 5 + 1e-12)
-
-        pin_strike, _, _ = max(((s, g, score_peak(s, g)) for s, g in nearby_positive), key=lambda x: x[2])
-        return float(pin_strike)
-
-    nearby_all = [(s, g) for s, g in gex_by_strike.items() if abs(s - index_price) < index_config.far_max]
-    if nearby_all:
-        pin_strike, _ = max(nearby_all, key=lambda x: abs(x[1]))
-        return float(pin_strike)
+    distance = np.abs(uniq - index_price)
+    within_far = distance < index_config.far_max
+    positive = totals > 0
+
+    nearby_positive = positive & (distance < max_distance)
+    if not nearby_positive.any():
+        nearby_positive = positive & within_far
+
+    # argmax returns the first strike in chain order on ties, as max() over the dict items did.
+    if nearby_positive.any():
+        distance_pct = distance * (1.0 / max(index_price, 1.0))
+        distance_sq = distance_pct * distance_pct
+        # x**5 as multiplications; np.power goes through the generic pow routine per element.
+        scores = np.where(nearby_positive, totals / (distance_sq * distance_sq * distance_pct + 1e-12), -np.inf)
+        return float(uniq[int(np.argmax(scores))])
+
+    if within_far.any():
+        magnitude = np.where(within_far, np.abs(totals), -np.inf)
+        return float(uniq[int(np.argmax(magnitude))])
     return None
 
 
@@ -306,23 +505,26 @@ def check_vix_spike(current_vix: float, lookback_minutes: int = 5) -> Tuple[bool
 
 
 def check_realized_volatility(index_symbol: str = "SPX", lookback_minutes: int = 30) -> Tuple[bool, str | None]:
-    ticker_map = {"SPX": "^GSPC", "NDX": "^NDX", "DJX": "^DJI"}
-    ticker = ticker_map.get(index_symbol, "^GSPC")
+    ticker = YF_INDEX_TICKERS.get(index_symbol, YF_DEFAULT_INDEX_TICKER)
 
     try:
-        data = _yf_download(ticker, period="2d", interval="5m", auto_adjust=True)
+        data = _yf_download(ticker, period="2d", interval="5m")
         if len(data) < 20:
             return True, None
 
-        data["bar_range"] = data["High"] - data["Low"]
+        # Plain arrays: the downloaded frame is shared through the quote memo and must not be mutated.
+        ranges = data["High"].to_numpy(dtype=float) - data["Low"].to_numpy(dtype=float)
         bars_needed = max(1, lookback_minutes // 5)
-        recent_bars = data.tail(bars_needed)
-        baseline_bars = data.iloc[:-bars_needed]
-        if baseline_bars.empty:
+        recent = ranges[-bars_needed:]
+        baseline = ranges[:-bars_needed]
+        if baseline.size == 0:
             return True, None
 
-        recent_avg = _safe_float(recent_bars["bar_range"].mean())
-        baseline_avg = _safe_float(baseline_bars["bar_range"].mean())
+        # Means skip missing bars, as pandas' mean() did.
+        recent = recent[~np.isnan(recent)]
+        baseline = baseline[~np.isnan(baseline)]
+        recent_avg = _safe_float(recent.mean()) if recent.size else None
+        baseline_avg = _safe_float(baseline.mean()) if baseline.size else None
         if recent_avg is None or baseline_avg is None or baseline_avg <= 0:
             return True, None
 
@@ -338,7 +540,7 @@ def check_realized_volatility(index_symbol: str = "SPX", lookback_minutes: int =
 def compute_expected_move_2hr(index_price: float | None, vix: float | None) -> float | None:
     if index_price is None or vix is None:
         return None
-    expected_move = index_price * (vix / 100) * math.sqrt(2.0 / (252 * 6.5))
+    expected_move = index_price * (vix / 100) * EXPECTED_MOVE_2HR_FACTOR
     return round(expected_move, 2)
 
 
@@ -414,7 +616,15 @@ def compute_tradeable_signal(
     market_snapshot: Dict[str, Any],
     core_signal: Dict[str, Any],
     use_external_volatility_checks: bool = True,
+    short_circuit: bool = False,
 ) -> Dict[str, Any]:
+    """
+    Run the entry filters and derive TRADE/NO_TRADE.
+
+    With `short_circuit`, the external (yfinance-backed) volatility checks are skipped once any
+    earlier check has blocked entry; the decision and primary reason are unchanged, but later
+    blocking reasons from those checks are not collected.
+    """
     reasons: List[str] = []
     checks: Dict[str, Dict[str, Any]] = {}
 
@@ -460,6 +670,19 @@ def compute_tradeable_signal(
         blackout_reason or "Blocked by timing blackout",
     )
 
+    # The timing checks above are free; once one blocks, the signal is NO_TRADE regardless, so skip
+    # the two yfinance downloads behind the external volatility checks.
+    timing_blocked = bool(reasons)
+
+    def external_skip_note() -> str | None:
+        if not use_external_volatility_checks:
+            return "dashboard fast mode"
+        if timing_blocked:
+            return "entry already blocked by session timing"
+        if short_circuit and reasons:
+            return "entry already blocked"
+        return None
+
     vix = _safe_float(market_snapshot.get("vix"))
     if vix is None:
         add_check("vix_available", False, "VIX available", "VIX unavailable")
@@ -471,7 +694,8 @@ def compute_tradeable_signal(
             f"VIX {vix:.2f} >= floor {VIX_FLOOR:.1f}",
             f"VIX {vix:.2f} below floor {VIX_FLOOR:.1f}",
         )
-        if use_external_volatility_checks:
+        skip_note = external_skip_note()
+        if skip_note is None:
             vix_safe, spike_reason = check_vix_spike(vix)
             add_check(
                 "vix_spike",
@@ -483,12 +707,13 @@ def compute_tradeable_signal(
             add_check(
                 "vix_spike",
                 True,
-                "Skipped external VIX spike check (dashboard fast mode)",
-                "Skipped external VIX spike check (dashboard fast mode)",
+                f"Skipped external VIX spike check ({skip_note})",
+                f"Skipped external VIX spike check ({skip_note})",
                 blocking=False,
             )
 
-    if use_external_volatility_checks:
+    skip_note = external_skip_note()
+    if skip_note is None:
         rvol_ok, rvol_reason = check_realized_volatility(index_config.code, lookback_minutes=30)
         add_check(
             "realized_volatility",
@@ -500,8 +725,8 @@ def compute_tradeable_signal(
         add_check(
             "realized_volatility",
             True,
-            "Skipped external realized-volatility check (dashboard fast mode)",
-            "Skipped external realized-volatility check (dashboard fast mode)",
+            f"Skipped external realized-volatility check ({skip_note})",
+            f"Skipped external realized-volatility check ({skip_note})",
             blocking=False,
         )
 
@@ -623,6 +848,29 @@ def compute_tradeable_signal(
     }
 
 
+def collect_extended_metrics(index_code: str) -> ExtendedMetrics:
+    """
+    Fetch the yfinance-backed inputs (RSI, down days, gap); defaults on failure.
+
+    Independent of the option chain, so callers may run it concurrently with the chain fetch.
+    """
+    index_config = get_index_config(index_code.upper())
+    etf_symbol = index_config.etf_symbol
+    try:
+        etf_future = _FETCH_POOL.submit(_daily_bars_or_empty, etf_symbol)
+        gap_future = etf_future if etf_symbol == GAP_SYMBOL else _FETCH_POOL.submit(_daily_bars_or_empty, GAP_SYMBOL)
+        etf_bars = etf_future.result(timeout=EXTENDED_METRICS_TIMEOUT_SECONDS)
+        gap_bars = gap_future.result(timeout=EXTENDED_METRICS_TIMEOUT_SECONDS)
+        return ExtendedMetrics(
+            rsi=get_rsi(etf_symbol, bars=etf_bars),
+            consecutive_down_days=get_consecutive_down_days(etf_symbol, bars=etf_bars),
+            gap_pct=calculate_gap_size(bars=gap_bars),
+            source="yfinance",
+        )
+    except Exception as exc:
+        return ExtendedMetrics(warning=f"Failed to collect extended metrics: {exc}")
+
+
 def build_dashboard_strategy(
     index_code: str,
     *,
@@ -632,9 +880,13 @@ def build_dashboard_strategy(
     now_utc: datetime.datetime | None = None,
     include_extended_metrics: bool = True,
     fast_mode: bool = True,
+    extended_metrics: ExtendedMetrics | None = None,
 ) -> Dict[str, Any]:
     """
     Build strategy payload for dashboard snapshots without writing signal logs.
+
+    Pass `extended_metrics` when they were already collected (e.g. prefetched
+    alongside the option chain); otherwise they are fetched here.
     """
     index_config = get_index_config(index_code.upper())
     now_utc = now_utc or datetime.datetime.now(tz=datetime.timezone.utc)
@@ -643,23 +895,16 @@ def build_dashboard_strategy(
     now_et = now_utc.astimezone(ET)
 
     warnings: List[str] = []
-    metrics_source = "defaults"
-
     if include_extended_metrics:
-        try:
-            rsi = get_rsi(index_config.etf_symbol)
-            consecutive_down_days = get_consecutive_down_days(index_config.etf_symbol)
-            gap_pct = calculate_gap_size()
-            metrics_source = "yfinance"
-        except Exception as exc:
-            rsi = 50.0
-            consecutive_down_days = 0
-            gap_pct = 0.0
-            warnings.append(f"Failed to collect extended metrics: {exc}")
+        metrics = extended_metrics or collect_extended_metrics(index_config.code)
     else:
-        rsi = 50.0
-        consecutive_down_days = 0
-        gap_pct = 0.0
+        metrics = ExtendedMetrics()
+    if metrics.warning:
+        warnings.append(metrics.warning)
+    metrics_source = metrics.source
+    rsi = metrics.rsi
+    consecutive_down_days = metrics.consecutive_down_days
+    gap_pct = metrics.gap_pct
 
     expected_move_2hr = compute_expected_move_2hr(index_price, vix)
     market_snapshot = {
@@ -690,6 +935,7 @@ def build_dashboard_strategy(
         market_snapshot=market_snapshot,
         core_signal=core_signal,
         use_external_volatility_checks=not fast_mode,
+        short_circuit=True,
     )
 
     return {
@@ -709,12 +955,57 @@ def build_dashboard_strategy(
     }
 
 
+# Today's signal log, kept open between appends; replaced when the date rolls over or the file at
+# that path is deleted/rotated. On Windows the open handle still blocks deleting or renaming the
+# file while a --watch run is alive; it is closed at exit.
+_signal_log: Tuple[Path, IO[bytes]] | None = None
+_signal_log_lock = threading.Lock()
+
+
+def _close_signal_log() -> None:
+    global _signal_log
+    with _signal_log_lock:
+        if _signal_log is not None:
+            _signal_log[1].close()
+            _signal_log = None
+
+
+atexit.register(_close_signal_log)
+
+
+def _is_open_file(file_path: Path, handle: IO[bytes]) -> bool:
+    try:
+        return os.path.samestat(os.stat(file_path), os.fstat(handle.fileno()))
+    except OSError:
+        return False
+
+
+def _signal_log_handle(file_path: Path) -> IO[bytes]:
+    global _signal_log
+    if _signal_log is not None:
+        if _signal_log[0] == file_path and _is_open_file(file_path, _signal_log[1]):
+            return _signal_log[1]
+        _signal_log[1].close()
+        _signal_log = None
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    handle = open(file_path, "ab")
+    _signal_log = (file_path, handle)
+    return handle
+
+
 def append_signal_log(record: Dict[str, Any], *, now_et: datetime.datetime | None = None) -> Path:
     now = now_et or datetime.datetime.now(ET)
     file_path = data_path(f"signals_{now.strftime('%Y%m%d')}.jsonl")
-    line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
-    with locked_open(file_path, "a", exclusive=True) as handle:
-        handle.write(line + "\n")
+    line = dumps_bytes(record) + b"\n"
+    with _signal_log_lock:
+        handle = _signal_log_handle(file_path)
+        # Still locked per append so other processes writing the same file never interleave lines.
+        lock_stream(handle, exclusive=True)
+        try:
+            handle.write(line)
+            handle.flush()
+        finally:
+            unlock_stream(handle)
     return file_path
 
 
@@ -729,25 +1020,43 @@ def evaluate_signal(index_code: str, *, overrides: SignalOverrides | None = None
     if not live_key:
         warnings.append("TRADIER_LIVE_KEY is not set; live quotes/GEX pin may be unavailable.")
 
-    if overrides.price_override is not None:
+    # Start every independent lookup before waiting on any; only the GEX pin needs the spot price.
+    spy_bars_future = _FETCH_POOL.submit(_daily_bars_or_empty, "SPY")
+    # Index, ETF proxy and VIX quotes come from one Tradier request; only the fallbacks run per lookup.
+    quote_symbols: List[str] = []
+    if overrides.price_override is None:
+        quote_symbols += [index_config.index_symbol, index_config.etf_symbol]
+    if overrides.vix_override is None:
+        quote_symbols.append("VIX")
+    quotes = _fetch_tradier_quotes_multi(tuple(quote_symbols), live_key)
+
+    price_future = None
+    if overrides.price_override is None:
+        price_future = _FETCH_POOL.submit(get_index_price, index_config, live_key, quotes=quotes)
+    vix_future = None
+    if overrides.vix_override is None:
+        vix_future = _FETCH_POOL.submit(get_vix, live_key, quotes=quotes)
+
+    if price_future is None:
         index_price = float(overrides.price_override)
         index_price_source = "override"
     else:
-        index_price, index_price_source = get_index_price(index_config, live_key)
+        index_price, index_price_source = price_future.result()
         if index_price is None:
             warnings.append(f"{index_config.code} spot price unavailable from Tradier/yfinance.")
 
-    if overrides.vix_override is not None:
+    if vix_future is None:
         vix = float(overrides.vix_override)
         vix_source = "override"
     else:
-        vix, vix_source = get_vix(live_key)
+        vix, vix_source = vix_future.result()
         if vix is None:
             warnings.append("VIX unavailable from Tradier/yfinance.")
 
-    rsi = get_rsi("SPY")
-    consec_down_days = get_consecutive_down_days("SPY")
-    gap_pct = calculate_gap_size()
+    spy_bars = spy_bars_future.result()
+    rsi = get_rsi("SPY", bars=spy_bars)
+    consec_down_days = get_consecutive_down_days("SPY", bars=spy_bars)
+    gap_pct = calculate_gap_size(bars=spy_bars)
     expected_move_2hr = compute_expected_move_2hr(index_price, vix)
 
     if overrides.pin_override is not None:
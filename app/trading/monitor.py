@@ -14,10 +14,10 @@ def main(argv: list[str] | None = None) -> int:
     load_dotenv()
     root = Path(__file__).resolve().parents[2]
     ensure_legacy_root_gamma(root)
-    env = os.environ.copy()
-    env.setdefault("PYTHONIOENCODING", "utf-8")
-    env.setdefault("PYTHONUTF8", "1")
-    return subprocess.call([sys.executable, str(root / "monitor.py"), *args], env=env)
+    # Set on our own environment so the child simply inherits it; no per-launch copy.
+    os.environ.setdefault("PYTHONIOENCODING", "utf-8")
+    os.environ.setdefault("PYTHONUTF8", "1")
+    return subprocess.call([sys.executable, str(root / "monitor.py"), *args])
 
 
 if __name__ == "__main__":
@@ -1,67 +1,142 @@
 ﻿"""Environment-based runtime configuration."""
 
+import functools
 import os
+from dataclasses import dataclass, fields
+from typing import Any, Mapping
 
 from app.common.paths import DISCORD_MESSAGES_FILE
 from app.config.runtime import load_dotenv
 
 load_dotenv()
 
-# Tradier Account IDs (no fallback - fail fast if not set)
-PAPER_ACCOUNT_ID = os.getenv("TRADIER_PAPER_ACCOUNT_ID")
-LIVE_ACCOUNT_ID = os.getenv("TRADIER_LIVE_ACCOUNT_ID")
-
-# Tradier API Keys
-TRADIER_SANDBOX_KEY = os.getenv("TRADIER_SANDBOX_KEY")
-TRADIER_LIVE_KEY = os.getenv("TRADIER_LIVE_KEY")
-
-# Validate required credentials (fail fast on startup)
-if not TRADIER_SANDBOX_KEY:
-    raise EnvironmentError("TRADIER_SANDBOX_KEY not set in environment or .env")
-if not TRADIER_LIVE_KEY:
-    raise EnvironmentError("TRADIER_LIVE_KEY not set in environment or .env")
-if not PAPER_ACCOUNT_ID:
-    raise EnvironmentError("TRADIER_PAPER_ACCOUNT_ID not set in environment or .env")
-if not LIVE_ACCOUNT_ID:
-    raise EnvironmentError("TRADIER_LIVE_ACCOUNT_ID not set in environment or .env")
-
-# Defaults (runtime code will override by mode)
-DEFAULT_ACCOUNT_ID = PAPER_ACCOUNT_ID
-DEFAULT_KEY = TRADIER_SANDBOX_KEY
-
-# Discord Webhook Settings
-DISCORD_ENABLED = os.getenv("GAMMA_DISCORD_ENABLED", "1").lower() not in {"0", "false", "no"}
-DISCORD_WEBHOOK_LIVE_URL = os.getenv("GAMMA_DISCORD_WEBHOOK_LIVE_URL", "")
-DISCORD_WEBHOOK_PAPER_URL = os.getenv("GAMMA_DISCORD_WEBHOOK_PAPER_URL", "")
-
-
-def _validate_discord_url(env_name: str, value: str) -> None:
-    if value and not value.startswith("https://discord.com/api/webhooks/"):
-        raise ValueError(
-            f"Invalid {env_name} format: must start with 'https://discord.com/api/webhooks/'\n"
-            f"Got: {value[:50]}..."
-        )
-
-
-_validate_discord_url("GAMMA_DISCORD_WEBHOOK_LIVE_URL", DISCORD_WEBHOOK_LIVE_URL)
-_validate_discord_url("GAMMA_DISCORD_WEBHOOK_PAPER_URL", DISCORD_WEBHOOK_PAPER_URL)
-
-# Delayed webhook (7 min delay) - for free tier
-DISCORD_DELAYED_ENABLED = os.getenv("GAMMA_DISCORD_DELAYED_ENABLED", "1").lower() not in {"0", "false", "no"}
-DISCORD_DELAYED_WEBHOOK_URL = os.getenv("GAMMA_DISCORD_DELAYED_WEBHOOK_URL", "")
-_validate_discord_url("GAMMA_DISCORD_DELAYED_WEBHOOK_URL", DISCORD_DELAYED_WEBHOOK_URL)
-DISCORD_DELAY_SECONDS = int(os.getenv("GAMMA_DISCORD_DELAY_SECONDS", "420"))
-
-# Discord Auto-Delete Settings
-DISCORD_AUTODELETE_ENABLED = os.getenv("GAMMA_DISCORD_AUTODELETE_ENABLED", "1").lower() not in {"0", "false", "no"}
-DISCORD_AUTODELETE_STORAGE = os.getenv("GAMMA_DISCORD_AUTODELETE_STORAGE", str(DISCORD_MESSAGES_FILE))
-
-# TTL (time-to-live) in seconds for different message types
-DISCORD_TTL_SIGNALS = int(os.getenv("GAMMA_DISCORD_TTL_SIGNALS", str(24 * 3600)))
-DISCORD_TTL_CRASHES = int(os.getenv("GAMMA_DISCORD_TTL_CRASHES", str(1 * 3600)))
-DISCORD_TTL_HEARTBEAT = int(os.getenv("GAMMA_DISCORD_TTL_HEARTBEAT", str(30 * 60)))
-DISCORD_TTL_DEFAULT = int(os.getenv("GAMMA_DISCORD_TTL_DEFAULT", str(2 * 3600)))
-
-# Healthcheck.io heartbeat URLs
-HEALTHCHECK_LIVE_URL = os.getenv("GAMMA_HEALTHCHECK_LIVE_URL", "")
-HEALTHCHECK_PAPER_URL = os.getenv("GAMMA_HEALTHCHECK_PAPER_URL", "")
+_FALSE_VALUES = {"0", "false", "no"}
+
+_DISCORD_WEBHOOK_PREFIX = "https://discord.com/api/webhooks/"
+
+# Checked in this order; the first missing one is reported.
+_REQUIRED_KEYS = (
+    "TRADIER_SANDBOX_KEY",
+    "TRADIER_LIVE_KEY",
+    "TRADIER_PAPER_ACCOUNT_ID",
+    "TRADIER_LIVE_ACCOUNT_ID",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    # Tradier Account IDs (no fallback - fail fast if not set)
+    PAPER_ACCOUNT_ID: str
+    LIVE_ACCOUNT_ID: str
+
+    # Tradier API Keys
+    TRADIER_SANDBOX_KEY: str
+    TRADIER_LIVE_KEY: str
+
+    # Defaults (runtime code will override by mode)
+    DEFAULT_ACCOUNT_ID: str
+    DEFAULT_KEY: str
+
+    # Discord Webhook Settings
+    DISCORD_ENABLED: bool
+    DISCORD_WEBHOOK_LIVE_URL: str
+    DISCORD_WEBHOOK_PAPER_URL: str
+
+    # Delayed webhook (7 min delay) - for free tier
+    DISCORD_DELAYED_ENABLED: bool
+    DISCORD_DELAYED_WEBHOOK_URL: str
+    DISCORD_DELAY_SECONDS: int
+
+    # Discord Auto-Delete Settings
+    DISCORD_AUTODELETE_ENABLED: bool
+    DISCORD_AUTODELETE_STORAGE: str
+
+    # TTL (time-to-live) in seconds for different message types
+    DISCORD_TTL_SIGNALS: int
+    DISCORD_TTL_CRASHES: int
+    DISCORD_TTL_HEARTBEAT: int
+    DISCORD_TTL_DEFAULT: int
+
+    # Healthcheck.io heartbeat URLs
+    HEALTHCHECK_LIVE_URL: str
+    HEALTHCHECK_PAPER_URL: str
+
+
+_CONFIG_FIELDS = frozenset(field.name for field in fields(Config))
+
+
+def _validate_discord_urls(urls: Mapping[str, str]) -> None:
+    for env_name, value in urls.items():
+        if value and not value.startswith(_DISCORD_WEBHOOK_PREFIX):
+            raise ValueError(
+                f"Invalid {env_name} format: must start with '{_DISCORD_WEBHOOK_PREFIX}'\n"
+                f"Got: {value[:50]}..."
+            )
+
+
+def _flag(env: Mapping[str, str], name: str) -> bool:
+    return env.get(name, "1").lower() not in _FALSE_VALUES
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config() -> Config:
+    # One snapshot of the environment; every key below is a plain dict lookup.
+    env = os.environ.copy()
+
+    # Validate required credentials (fail fast on startup)
+    required = {name: env.get(name) for name in _REQUIRED_KEYS}
+    for name, value in required.items():
+        if not value:
+            raise EnvironmentError(f"{name} not set in environment or .env")
+
+    discord_enabled = _flag(env, "GAMMA_DISCORD_ENABLED")
+    delayed_enabled = _flag(env, "GAMMA_DISCORD_DELAYED_ENABLED")
+    live_url = env.get("GAMMA_DISCORD_WEBHOOK_LIVE_URL", "")
+    paper_url = env.get("GAMMA_DISCORD_WEBHOOK_PAPER_URL", "")
+    delayed_url = env.get("GAMMA_DISCORD_DELAYED_WEBHOOK_URL", "")
+    # Webhook URLs are only checked when the channel that posts to them is enabled.
+    webhooks: dict[str, str] = {}
+    if discord_enabled:
+        webhooks["GAMMA_DISCORD_WEBHOOK_LIVE_URL"] = live_url
+        webhooks["GAMMA_DISCORD_WEBHOOK_PAPER_URL"] = paper_url
+    if delayed_enabled:
+        webhooks["GAMMA_DISCORD_DELAYED_WEBHOOK_URL"] = delayed_url
+    _validate_discord_urls(webhooks)
+
+    return Config(
+        PAPER_ACCOUNT_ID=required["TRADIER_PAPER_ACCOUNT_ID"],
+        LIVE_ACCOUNT_ID=required["TRADIER_LIVE_ACCOUNT_ID"],
+        TRADIER_SANDBOX_KEY=required["TRADIER_SANDBOX_KEY"],
+        TRADIER_LIVE_KEY=required["TRADIER_LIVE_KEY"],
+        DEFAULT_ACCOUNT_ID=required["TRADIER_PAPER_ACCOUNT_ID"],
+        DEFAULT_KEY=required["TRADIER_SANDBOX_KEY"],
+        DISCORD_ENABLED=discord_enabled,
+        DISCORD_WEBHOOK_LIVE_URL=live_url,
+        DISCORD_WEBHOOK_PAPER_URL=paper_url,
+        DISCORD_DELAYED_ENABLED=delayed_enabled,
+        DISCORD_DELAYED_WEBHOOK_URL=delayed_url,
+        DISCORD_DELAY_SECONDS=int(env.get("GAMMA_DISCORD_DELAY_SECONDS", "420")),
+        DISCORD_AUTODELETE_ENABLED=_flag(env, "GAMMA_DISCORD_AUTODELETE_ENABLED"),
+        DISCORD_AUTODELETE_STORAGE=env.get("GAMMA_DISCORD_AUTODELETE_STORAGE", str(DISCORD_MESSAGES_FILE)),
+        DISCORD_TTL_SIGNALS=int(env.get("GAMMA_DISCORD_TTL_SIGNALS", str(24 * 3600))),
+        DISCORD_TTL_CRASHES=int(env.get("GAMMA_DISCORD_TTL_CRASHES", str(1 * 3600))),
+        DISCORD_TTL_HEARTBEAT=int(env.get("GAMMA_DISCORD_TTL_HEARTBEAT", str(30 * 60))),
+        DISCORD_TTL_DEFAULT=int(env.get("GAMMA_DISCORD_TTL_DEFAULT", str(2 * 3600))),
+        HEALTHCHECK_LIVE_URL=env.get("GAMMA_HEALTHCHECK_LIVE_URL", ""),
+        HEALTHCHECK_PAPER_URL=env.get("GAMMA_HEALTHCHECK_PAPER_URL", ""),
+    )
+
+
+# Built (and validated) at import so missing credentials still fail fast.
+_load_config()
+
+
+def __getattr__(name: str) -> Any:
+    # `from config import TRADIER_LIVE_KEY` keeps working; values come from the cached Config.
+    if name in _CONFIG_FIELDS:
+        return getattr(_load_config(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _CONFIG_FIELDS)
@@ -4,80 +4,209 @@ GEX BlackBox Continuous Collector - Collect every 30 seconds during market hours
 
 Cross-platform version:
 - Uses repository paths (no /root or /var/log)
-- Uses current Python interpreter for subprocess calls
+- Records snapshots in-process (no interpreter start per snapshot)
 """
 
-import subprocess
+import atexit
+import os
+import signal
 import sys
+import threading
 
 if hasattr(sys.stdout, 'reconfigure'):
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 if hasattr(sys.stderr, 'reconfigure'):
     sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 import time
-from datetime import datetime, time as dt_time
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Any, TextIO, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-import pytz
-
-from app.common.paths import LOGS_DIR, PROJECT_ROOT
+from app.common.paths import LOGS_DIR
 from app.config.runtime import load_dotenv
 
-load_dotenv()
-
 # Market hours in ET
 MARKET_OPEN = dt_time(9, 30)   # 9:30 AM ET
 MARKET_CLOSE = dt_time(16, 0)  # 4:00 PM ET
-ET = pytz.timezone('America/New_York')
+try:
+    ET = ZoneInfo('America/New_York')
+except ZoneInfoNotFoundError:
+    # Windows has no system tz database; without the tzdata package fall back to pytz.
+    import pytz
+
+    ET = pytz.timezone('America/New_York')
 
 COLLECTION_INTERVAL = 30  # seconds
+MAX_CLOSED_SLEEP = 3600  # seconds; re-check hourly so DST shifts and clock changes self-correct
+COLLECTION_TIMEOUT = 30  # seconds
+
+# One worker, and no new submit while a snapshot that overran its timeout is still running
+# (a thread cannot be killed like the old child process), so late runs never queue up.
+_RECORDER_THREAD_PREFIX = "blackbox-recorder"
+_recorder_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix=_RECORDER_THREAD_PREFIX)
+_overrun: Future | None = None
 LOG_FILE = LOGS_DIR / 'gex_blackbox_collector.log'
 
+# Set by the SIGTERM handler; the loop waits on it instead of sleeping so shutdown is immediate.
+_stop_event = threading.Event()
+
+
+def _handle_sigterm(signum, frame) -> None:
+    _stop_event.set()
+
+
+# Opened once in append mode so the SPX and NDX collectors can share the file. Writes are
+# block-buffered and flushed in batches (and on status changes / exit) instead of once per line;
+# a batch stays far below the buffer size, so flushes land on line boundaries.
+LOG_FLUSH_LINES = 32
+LOG_FLUSH_SECONDS = 300
+
+_log_handle: TextIO | None = None
+_log_pending = 0
+_log_flushed_at = 0.0
+
 
-def append_log(message: str) -> None:
+def _log_stream() -> TextIO:
+    global _log_handle, _log_flushed_at
+    if _log_handle is None:
+        _log_handle = open(LOG_FILE, 'a', encoding='utf-8')
+        _log_flushed_at = time.monotonic()
+        atexit.register(_log_handle.close)
+    return _log_handle
+
+
+def flush_log() -> None:
+    global _log_pending, _log_flushed_at
+    if _log_handle is not None:
+        _log_handle.flush()
+    _log_pending = 0
+    _log_flushed_at = time.monotonic()
+
+
+def append_log(message: str, *, flush: bool = False) -> None:
+    global _log_pending
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(LOG_FILE, 'a', encoding='utf-8') as f:
-        f.write(f"[{now}] {message}\n")
+    _log_stream().write(f"[{now}] {message}\n")
+    _log_pending += 1
+    if flush or _log_pending >= LOG_FLUSH_LINES or time.monotonic() - _log_flushed_at >= LOG_FLUSH_SECONDS:
+        flush_log()
+
+
+def _et_timestamp(day: date, at: dt_time) -> float:
+    naive = datetime.combine(day, at)
+    if hasattr(ET, 'localize'):  # pytz fallback needs localize() to pick the right DST offset
+        return ET.localize(naive).timestamp()
+    return naive.replace(tzinfo=ET).timestamp()
+
+
+# (day_end, open, close) as UNIX timestamps for the current ET day; open/close are None on weekends.
+_session_cache: Tuple[float, float | None, float | None] | None = None
 
 
 def is_market_open() -> bool:
     """Check if market is currently open."""
+    global _session_cache
+    now = time.time()
+    if _session_cache is None or now >= _session_cache[0]:
+        today_et = datetime.fromtimestamp(now, ET).date()
+        day_end = _et_timestamp(today_et + timedelta(days=1), dt_time(0, 0))
+        # Check if it's a trading day (Mon-Fri)
+        if today_et.weekday() >= 5:  # Saturday=5, Sunday=6
+            _session_cache = (day_end, None, None)
+        else:
+            _session_cache = (day_end, _et_timestamp(today_et, MARKET_OPEN), _et_timestamp(today_et, MARKET_CLOSE))
+
+    # Check if it's within market hours
+    _, open_ts, close_ts = _session_cache
+    return open_ts is not None and open_ts <= now < close_ts
+
+
+def _record(index_symbol: str) -> bool:
+    # Imported on first use (then cached) so a bad config is logged per attempt, as a failing
+    # child process was, instead of killing the collector at startup.
+    import gex_blackbox_recorder
+
+    if not os.path.exists(gex_blackbox_recorder.DB_PATH):
+        gex_blackbox_recorder.init_database()
+    return gex_blackbox_recorder.record_snapshot(index_symbol)
+
+
+def _next_market_open(now_et: datetime) -> datetime:
+    """Next Mon-Fri MARKET_OPEN at or after `now_et` (holidays are not known here)."""
+    candidate = now_et.replace(
+        hour=MARKET_OPEN.hour, minute=MARKET_OPEN.minute, second=0, microsecond=0
+    )
+    if candidate <= now_et:
+        candidate += timedelta(days=1)
+    while candidate.weekday() >= 5:
+        candidate += timedelta(days=1)
+    return candidate
+
+
+def seconds_until_market_open() -> float:
     now_et = datetime.now(ET)
+    wait = (_next_market_open(now_et) - now_et).total_seconds()
+    return min(max(wait, 1.0), MAX_CLOSED_SLEEP)
 
-    # Check if it's a trading day (Mon-Fri)
-    if now_et.weekday() >= 5:  # Saturday=5, Sunday=6
-        return False
 
-    # Check if it's within market hours
-    current_time = now_et.time()
-    return MARKET_OPEN <= current_time < MARKET_CLOSE
+class _QuietRecorderStream:
+    """
+    Drops output written from the recorder thread and passes everything else through.
 
+    record_snapshot prints ~10 progress lines per call; the old child process's output was
+    captured and discarded. Installed once at startup, unlike redirect_stdout, which would
+    swap the stream for every thread while a snapshot runs.
+    """
 
-def collect_snapshot(index_symbol: str) -> bool:
-    """Collect a single snapshot."""
-    try:
-        result = subprocess.run(
-            [sys.executable, str(PROJECT_ROOT / 'gex_blackbox_recorder.py'), index_symbol],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-
-        if result.returncode == 0:
-            if 'Snapshot saved' in result.stdout:
-                append_log(f"{index_symbol} collection successful")
-                return True
-            append_log(f"{index_symbol} returned success but no snapshot marker")
-            return True
-
-        append_log(f"{index_symbol} collection failed (exit {result.returncode})")
-        return False
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        if threading.current_thread().name.startswith(_RECORDER_THREAD_PREFIX):
+            return len(text)
+        return self._stream.write(text)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
 
-    except subprocess.TimeoutExpired:
-        append_log(f"{index_symbol} collection timeout")
+
+def _snapshot_outcome(future: Future, index_symbol: str, suffix: str = "") -> bool:
+    try:
+        ok = future.result(timeout=0)
+    except SystemExit as e:
+        # The recorder exits when config.py cannot provide TRADIER_LIVE_KEY.
+        append_log(f"{index_symbol} collection failed{suffix} (exit {e.code})")
         return False
     except Exception as e:
-        append_log(f"{index_symbol} collection error: {e}")
+        append_log(f"{index_symbol} collection error{suffix}: {e}")
         return False
+    append_log(f"{index_symbol} collection {'successful' if ok else 'failed'}{suffix}")
+    return bool(ok)
+
+
+def finish_overrun_snapshot(index_symbol: str) -> bool | None:
+    """Outcome of a snapshot that overran its timeout and has since finished, else None."""
+    global _overrun
+    if _overrun is None or not _overrun.done():
+        return None
+    future, _overrun = _overrun, None
+    return _snapshot_outcome(future, index_symbol, " (late)")
+
+
+def collect_snapshot(index_symbol: str) -> bool | None:
+    """Collect a single snapshot; None when it is still running and will be reported later."""
+    global _overrun
+    if _overrun is not None:
+        append_log(f"{index_symbol} previous snapshot still running; skipped")
+        return None
+    future = _recorder_pool.submit(_record, index_symbol)
+    done, _ = wait_futures((future,), timeout=COLLECTION_TIMEOUT)
+    if not done:
+        _overrun = future
+        append_log(f"{index_symbol} collection timeout; still running")
+        return None
+    return _snapshot_outcome(future, index_symbol)
 
 
 def main(index_symbol: str) -> None:
@@ -89,54 +218,71 @@ def main(index_symbol: str) -> None:
         sys.exit(1)
 
     index_symbol = index_symbol.upper()
+    sys.stdout = _QuietRecorderStream(sys.stdout)
+    sys.stderr = _QuietRecorderStream(sys.stderr)
+    # Loaded after the argument check so a usage error exits without touching .env.
+    load_dotenv()
 
     print(f"GEX BlackBox Continuous Collector - {index_symbol}")
     print(f"Collection interval: {COLLECTION_INTERVAL} seconds")
     print(f"Market hours: {MARKET_OPEN.strftime('%H:%M')} - {MARKET_CLOSE.strftime('%H:%M')} ET (Mon-Fri)")
     print("Starting collection loop...")
 
-    with open(LOG_FILE, 'a', encoding='utf-8') as f:
-        f.write(f"\n{'='*70}\n")
-        f.write(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting {index_symbol} collector\n")
-        f.write(f"{'='*70}\n")
+    _log_stream().write(
+        f"\n{'='*70}\n"
+        f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting {index_symbol} collector\n"
+        f"{'='*70}\n"
+    )
+    flush_log()
 
     collection_count = 0
     error_count = 0
     last_market_status = None
+    # systemd/Docker stop with SIGTERM; end the loop cleanly so the totals below still get logged.
+    signal.signal(signal.SIGTERM, _handle_sigterm)
 
     try:
-        while True:
+        while not _stop_event.is_set():
             market_open = is_market_open()
 
             if market_open != last_market_status:
                 status_str = "OPEN" if market_open else "CLOSED"
-                append_log(f"Market status: {status_str}")
+                append_log(f"Market status: {status_str}", flush=True)
                 last_market_status = market_open
 
             if market_open:
-                if collect_snapshot(index_symbol):
-                    collection_count += 1
-                else:
-                    error_count += 1
-
-            time.sleep(COLLECTION_INTERVAL)
+                for result in (finish_overrun_snapshot(index_symbol), collect_snapshot(index_symbol)):
+                    if result is True:
+                        collection_count += 1
+                    elif result is False:
+                        error_count += 1
+                _stop_event.wait(COLLECTION_INTERVAL)
+            else:
+                # Nothing to collect until the open; skip the 30s polling overnight and on weekends.
+                _stop_event.wait(seconds_until_market_open())
+        stop_reason = "SIGTERM"
 
     except KeyboardInterrupt:
-        with open(LOG_FILE, 'a', encoding='utf-8') as f:
-            f.write(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Collector stopped (SIGINT)\n")
-            f.write(f"Total collections: {collection_count}, Errors: {error_count}\n")
-        print(f"\nCollector stopped. Total: {collection_count}, Errors: {error_count}")
-        sys.exit(0)
+        stop_reason = "SIGINT"
     except Exception as e:
-        append_log(f"Fatal error: {e}")
+        append_log(f"Fatal error: {e}", flush=True)
         print(f"Fatal error: {e}")
         sys.exit(1)
 
+    _log_stream().write(
+        f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Collector stopped ({stop_reason})\n"
+        f"Total collections: {collection_count}, Errors: {error_count}\n"
+    )
+    flush_log()
+    print(f"\nCollector stopped. Total: {collection_count}, Errors: {error_count}")
+    sys.exit(0)
+
 
 if __name__ == '__main__':
-    if len(sys.argv) < 2:
+    argv = sys.argv[1:]
+    if not argv:
         print("Usage: python gex_blackbox_continuous_collector.py <SPX|NDX>")
         sys.exit(1)
 
-    main(sys.argv[1])
+    main(argv[0])
 
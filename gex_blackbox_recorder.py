@@ -441,7 +441,7 @@ def record_snapshot(index_symbol):
 
     try:
         # Store raw chain snapshot
-        chain_json = json.dumps(chain)
+        chain_json = json.dumps(chain, separators=(",", ":"))
         cursor.execute("""
             INSERT OR REPLACE INTO options_snapshots
             (timestamp, index_symbol, underlying_price, vix, expiration, chain_data)
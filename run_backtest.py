@@ -3,12 +3,13 @@
 
 from __future__ import annotations
 
+import functools
 import os
-import subprocess
+import runpy
 import sys
 from pathlib import Path
 
-from app.common.compat import ensure_legacy_root_gamma
+from app.common.compat import ensure_legacy_root_gamma, run_python_script
 from app.config.runtime import load_dotenv
 
 
@@ -16,20 +17,42 @@ def list_backtests(root: Path) -> list[str]:
     return sorted(path.name for path in root.glob("backtest_*.py"))
 
 
+@functools.lru_cache(maxsize=None)
+def _py_files(root: Path) -> frozenset[str]:
+    # One directory read instead of a stat per candidate; normcase matches Windows' case-insensitive lookup.
+    with os.scandir(root) as entries:
+        return frozenset(os.path.normcase(entry.name) for entry in entries if entry.name.endswith(".py"))
+
+
 def resolve_target(root: Path, name: str) -> Path:
-    target = root / name
-    if target.suffix != ".py":
-        target = target.with_suffix(".py")
-    if target.exists():
-        return target
-    prefixed = root / f"backtest_{name}"
-    if prefixed.suffix != ".py":
-        prefixed = prefixed.with_suffix(".py")
-    if prefixed.exists():
-        return prefixed
+    for candidate in (name, f"backtest_{name}"):
+        target = root / candidate
+        if target.suffix != ".py":
+            target = target.with_suffix(".py")
+        if target.parent == root:
+            found = os.path.normcase(target.name) in _py_files(root)
+        else:
+            found = target.exists()  # Paths outside the project root are checked directly.
+        if found:
+            return target
     raise FileNotFoundError(name)
 
 
+def _in_process_requested() -> bool:
+    return os.getenv("BACKTEST_IN_PROCESS", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _run_in_process(target: Path, args: list[str]) -> int:
+    # Reuses this interpreter's imports, .env load and legacy alias instead of starting a new one.
+    # Opt-in: a script that leaves global state behind or expects a fresh process still gets one.
+    sys.argv = [str(target), *args]
+    script_dir = str(target.parent)
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)  # What `python <script>` would put first on the path.
+    runpy.run_path(str(target), run_name="__main__")
+    return 0
+
+
 def main() -> int:
     load_dotenv()
     root = Path(__file__).resolve().parent
@@ -51,10 +74,13 @@ def main() -> int:
         print(f"Backtest not found: {sys.argv[1]}")
         return 1
 
-    env = os.environ.copy()
-    env.setdefault("PYTHONIOENCODING", "utf-8")
-    env.setdefault("PYTHONUTF8", "1")
-    return subprocess.call([sys.executable, str(target), *sys.argv[2:]], env=env)
+    if _in_process_requested():
+        return _run_in_process(target, sys.argv[2:])
+
+    # Set on our own environment so the child simply inherits it; no per-launch copy.
+    os.environ.setdefault("PYTHONIOENCODING", "utf-8")
+    os.environ.setdefault("PYTHONUTF8", "1")
+    return run_python_script(target, sys.argv[2:])
 
 
 if __name__ == "__main__":
@@ -2,11 +2,10 @@
 """Windows-friendly entrypoint for blackbox recorder."""
 
 import os
-import subprocess
 import sys
 from pathlib import Path
 
-from app.common.compat import ensure_legacy_root_gamma
+from app.common.compat import ensure_legacy_root_gamma, run_python_script
 from app.config.runtime import load_dotenv
 
 
@@ -15,10 +14,10 @@ def main() -> int:
     root = Path(__file__).resolve().parent
     ensure_legacy_root_gamma(root)
     target = root / "gex_blackbox_recorder.py"
-    env = os.environ.copy()
-    env.setdefault("PYTHONIOENCODING", "utf-8")
-    env.setdefault("PYTHONUTF8", "1")
-    return subprocess.call([sys.executable, str(target), *sys.argv[1:]], env=env)
+    # Set on our own environment so the child simply inherits it; no per-launch copy.
+    os.environ.setdefault("PYTHONIOENCODING", "utf-8")
+    os.environ.setdefault("PYTHONUTF8", "1")
+    return run_python_script(target, sys.argv[1:])
 
 
 if __name__ == "__main__":
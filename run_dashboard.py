@@ -4,15 +4,17 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import sys
 from pathlib import Path
 
 from app.api import create_dashboard_server
-from app.common.compat import ensure_legacy_root_gamma
+from app.common.compat import ensure_legacy_root_gamma, interval_seconds
 from app.config.runtime import load_dotenv
 from app.providers import SchwabClient, SchwabClientError
 from app.services import MarketSnapshotService
+from app.services.history_files import HISTORY_FORMAT_JSONL
 
 
 def _parse_bool_env(name: str, default: bool) -> bool:
@@ -27,7 +29,9 @@ def _parse_bool_env(name: str, default: bool) -> bool:
     return default
 
 
-def parse_args() -> argparse.Namespace:
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    # Built on first use rather than at import so the env defaults see values loaded by load_dotenv().
     default_host = os.getenv("DASHBOARD_HOST", "127.0.0.1")
     default_port = int(os.getenv("DASHBOARD_PORT", "8787"))
     default_refresh = int(os.getenv("DASHBOARD_REFRESH_SECONDS", "12"))
@@ -36,7 +40,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--port", type=int, default=default_port, help=f"Bind port (default: {default_port})")
     parser.add_argument(
         "--refresh-seconds",
-        type=int,
+        type=interval_seconds,
         default=default_refresh,
         help=f"Snapshot refresh cadence in seconds (default: {default_refresh})",
     )
@@ -46,7 +50,11 @@ def parse_args() -> argparse.Namespace:
         choices=["SPX", "NDX"],
         help="Index code to preload on startup.",
     )
-    return parser.parse_args()
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    return _build_parser().parse_args()
 
 
 def main() -> int:
@@ -55,12 +63,16 @@ def main() -> int:
     ensure_legacy_root_gamma(root)
     args = parse_args()
     strategy_fast_mode = _parse_bool_env("DASHBOARD_STRATEGY_FAST_MODE", True)
+    history_format = os.getenv("DASHBOARD_HISTORY_FORMAT", HISTORY_FORMAT_JSONL)
+    history_file_lock = _parse_bool_env("DASHBOARD_HISTORY_FILE_LOCK", True)
 
     client = SchwabClient()
     service = MarketSnapshotService(
         client=client,
         refresh_seconds=args.refresh_seconds,
         strategy_fast_mode=strategy_fast_mode,
+        history_format=history_format,
+        history_file_lock=history_file_lock,
     )
 
     # Warm up once so startup reveals credential/API issues early.
@@ -86,6 +98,7 @@ def main() -> int:
     base_url = f"http://{args.host}:{args.port}/"
     print(f"Dashboard running at {base_url}")
     print(f"Strategy fast mode: {strategy_fast_mode} (set DASHBOARD_STRATEGY_FAST_MODE=0 for strict checks)")
+    print(f"History format: {service.history_format} (set DASHBOARD_HISTORY_FORMAT=msgpack for binary history)")
     print("Read-only mode: no order placement code is executed.")
     try:
         server.serve_forever()
@@ -93,6 +106,7 @@ def main() -> int:
         print("\nShutting down dashboard server...")
     finally:
         server.server_close()
+        service.close()
     return 0
 
 
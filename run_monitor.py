@@ -5,10 +5,11 @@ Trade monitoring has been retired in this repository build.
 Use `run_dashboard.py` for the read-only information board.
 """
 
+from app.common.compat import disabled_entrypoint
+
+
 def main() -> int:
-    print("run_monitor.py is disabled: trading monitor was removed.")
-    print("Use: python run_dashboard.py")
-    return 1
+    return disabled_entrypoint("run_monitor.py", "trading monitor")
 
 
 if __name__ == "__main__":
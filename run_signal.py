@@ -4,25 +4,32 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import threading
 import time
 from pathlib import Path
 
-from app.common.compat import ensure_legacy_root_gamma
+from app.common.compat import ensure_legacy_root_gamma, interval_seconds
 from app.config.runtime import load_dotenv
 from app.providers import SchwabClient
 from app.services import MarketSnapshotService
 
 
-def parse_args() -> argparse.Namespace:
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Gamma signal-only mode (Schwab). Read-only; never places orders."
     )
     parser.add_argument("index", nargs="?", default="SPX", choices=["SPX", "NDX"], help="Index code.")
     parser.add_argument("--watch", action="store_true", help="Continuously evaluate signals.")
-    parser.add_argument("--interval", type=int, default=15, help="Seconds between evaluations in watch mode.")
+    parser.add_argument("--interval", type=interval_seconds, default=15, help="Seconds between evaluations in watch mode.")
     parser.add_argument("--json", dest="json_output", action="store_true", help="Print JSON output.")
-    return parser.parse_args()
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    return _build_parser().parse_args()
 
 
 def _format_human(snapshot: dict) -> str:
@@ -54,10 +61,9 @@ def main() -> int:
     ensure_legacy_root_gamma(root)
     args = parse_args()
 
-    if args.interval < 5:
-        raise SystemExit("ERROR: --interval must be >= 5 seconds")
-
     client = SchwabClient()
+    # Overlap the token refresh and TLS handshake with service setup instead of paying them in the first refresh.
+    threading.Thread(target=client.warm_up, name="schwab-warmup", daemon=True).start()
     service = MarketSnapshotService(client=client, refresh_seconds=args.interval)
 
     print("SIGNAL MODE (Schwab): read-only evaluation. No orders will be sent.", flush=True)
@@ -65,7 +71,7 @@ def main() -> int:
         while True:
             snapshot = service.refresh_snapshot(args.index)
             if args.json_output:
-                print(json.dumps(snapshot, ensure_ascii=False), flush=True)
+                print(json.dumps(snapshot, ensure_ascii=False, separators=(",", ":")), flush=True)
             else:
                 print(_format_human(snapshot), flush=True)
                 print("-" * 90, flush=True)
@@ -74,6 +80,8 @@ def main() -> int:
             time.sleep(args.interval)
     except KeyboardInterrupt:
         return 130
+    finally:
+        service.close()
     return 0
 
 